@@ -193,7 +193,7 @@ class AdvancedProfiler:
         if not self.metrics_history:
             return 100.0
             
-        latest_metrics = list(self.metrics_history)[-1]  # Get most recent
+        latest_metrics = self.metrics_history[-1]  # Get most recent
         
         # Component scores
         cpu_score = max(0, 100 - latest_metrics['cpu']['percent'])
@@ -214,7 +214,7 @@ class AdvancedProfiler:
         if not self.metrics_history:
             return ["Start monitoring to receive personalized recommendations"]
             
-        latest_metrics = list(self.metrics_history)[-1]
+        latest_metrics = self.metrics_history[-1]
         
         if latest_metrics['cpu']['percent'] > 70:
             recommendations.append("Consider optimizing CPU-intensive processes or upgrading CPU")
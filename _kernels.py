@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Numba helpers and the numeric kernels shared by the analysis tools
+Compiled with Numba when it is installed, plain Python otherwise
+
+Kernels used by a single tool live in that tool's own kernel module, so importing
+one tool's kernels never compiles another's.
+"""
+
+import warnings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange, types
+except ImportError:
+    njit = types = None
+    prange = range
+    warnings.warn("numba not installed; falling back to pure Python", RuntimeWarning)
+
+# float64 column -> (min, max, mean, std)
+COLUMN_STATS_SIGNATURE = types.UniTuple(types.float64, 4)(types.float64[::1]) if types else None
+
+def maybe_njit(fn=None, *, signature=None, **options):
+    """JIT-compile fn with an on-disk cache, or return it unchanged without Numba
+
+    With a signature the kernel is compiled eagerly, skipping type inference on first call.
+    Other options (e.g. parallel=True) are passed through to njit.
+    """
+    if fn is None:
+        return lambda f: maybe_njit(f, signature=signature, **options)
+    if njit is None:
+        return fn
+    if signature is None:
+        return njit(cache=True, **options)(fn)
+    return njit(signature, cache=True, **options)(fn)
+
+@maybe_njit(signature=COLUMN_STATS_SIGNATURE)
+def column_stats(values):
+    """Min, max, mean and population std of a non-empty column in two passes
+
+    Squared deviations are summed in a second pass rather than with the one-pass
+    sum-of-squares formula, which loses precision when the spread is small.
+    """
+    n = len(values)
+    low = values[0]
+    high = values[0]
+    total = 0.0
+    for i in range(n):
+        x = values[i]
+        if x < low:
+            low = x
+        if x > high:
+            high = x
+        total += x
+    mean = total / n
+    m2 = 0.0
+    for i in range(n):
+        deviation = values[i] - mean
+        m2 += deviation * deviation
+    return low, high, mean, (m2 / n) ** 0.5
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Rolling-window and history kernels for the performance monitor
+Compiled with Numba when it is installed, plain Python otherwise
+"""
+
+from _kernels import column_stats, maybe_njit, np, prange, types
+
+# (ring buffer, head, count, window) -> (mean, std) for float64 sample rings
+WINDOW_STATS_SIGNATURE = (types.UniTuple(types.float64, 2)(types.float64[::1], types.int64, types.int64, types.int64)
+                          if types else None)
+
+# (rows x slots, count) -> rows x (min, max, mean, std)
+ALL_COLUMN_STATS_SIGNATURE = types.float64[:, ::1](types.float64[:, ::1], types.int64) if types else None
+
+# (history rows x slots, sample, head, count, moments, moment rows, window), updated in place
+PUSH_SAMPLE_SIGNATURE = (types.void(types.float64[:, ::1], types.float64[::1], types.int64, types.int64,
+                                    types.float64[:, ::1], types.int64[::1], types.int64)
+                         if types else None)
+
+@maybe_njit(signature=WINDOW_STATS_SIGNATURE)
+def window_mean_std(ring, head, count, window):
+    """Mean and population std of the newest min(window, count) samples written before head
+
+    Single pass with Welford's update, reading the ring in place.
+    """
+    n = min(window, count)
+    if n == 0:
+        return 0.0, 0.0
+    size = len(ring)
+    mean = 0.0
+    m2 = 0.0
+    for k in range(n):
+        x = ring[(head - n + k) % size]
+        delta = x - mean
+        mean += delta / (k + 1)
+        m2 += (x - mean) * delta
+    return mean, (m2 / n) ** 0.5
+
+@maybe_njit(signature=PUSH_SAMPLE_SIGNATURE)
+def push_sample(history, sample, head, count, moments, moment_rows, window):
+    """Store a sample into ring slot head and roll the [mean, M2] window moments of moment_rows
+
+    history holds one row per metric; count is the number of samples stored before this one.
+    Once the window is full, the sample leaving it is replaced in a single Welford step.
+    """
+    size = history.shape[1]
+    filled = min(count, window)
+    for r in range(len(moment_rows)):
+        row = moment_rows[r]
+        x = sample[row]
+        mean = moments[r, 0]
+        m2 = moments[r, 1]
+        if filled == window:
+            evicted = history[row, (head - window) % size]
+            delta = x - evicted
+            new_mean = mean + delta / window
+            m2 += delta * (x - new_mean + evicted - mean)
+            mean = new_mean
+        else:
+            delta = x - mean
+            mean += delta / (filled + 1)
+            m2 += delta * (x - mean)
+        moments[r, 0] = mean
+        moments[r, 1] = max(m2, 0.0)
+    for row in range(history.shape[0]):
+        history[row, head] = sample[row]
+
+@maybe_njit(signature=ALL_COLUMN_STATS_SIGNATURE, parallel=True)
+def all_column_stats(rows, count):
+    """column_stats over the first count samples of every row, one row per thread"""
+    out = np.empty((rows.shape[0], 4))
+    for r in prange(rows.shape[0]):
+        low, high, mean, std = column_stats(rows[r, :count])
+        out[r, 0] = low
+        out[r, 1] = high
+        out[r, 2] = mean
+        out[r, 3] = std
+    return out
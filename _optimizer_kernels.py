@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Byte-counting kernels for the performance auto-optimizer
+Compiled with Numba when it is installed, plain Python otherwise
+"""
+
+from _kernels import maybe_njit, types
+
+# Eager signature for kernels counting over a read-only byte buffer (np.frombuffer of bytes)
+BYTES_COUNTER_SIGNATURE = types.int64(types.Array(types.uint8, 1, 'C', readonly=True)) if types else None
+
+@maybe_njit
+def _is_word_byte(c):
+    """ASCII [A-Za-z0-9_], matching \\b in bytes regexes"""
+    return (97 <= c <= 122) or (65 <= c <= 90) or (48 <= c <= 57) or c == 95
+
+@maybe_njit(signature=BYTES_COUNTER_SIGNATURE)
+def js_complexity(buf):
+    """Count JS decision points: whole-word if/for/while/case/catch, && and ||"""
+    count = 0
+    n = len(buf)
+    i = 0
+    while i < n:
+        c = buf[i]
+        if (c == 38 or c == 124) and i + 1 < n and buf[i + 1] == c:  # && or ||
+            count += 1
+            i += 2
+        elif _is_word_byte(c):
+            start = i
+            while i < n and _is_word_byte(buf[i]):
+                i += 1
+            length = i - start
+            first = buf[start]
+            if length == 2:
+                if first == 105 and buf[start + 1] == 102:  # if
+                    count += 1
+            elif length == 3:
+                if first == 102 and buf[start + 1] == 111 and buf[start + 2] == 114:  # for
+                    count += 1
+            elif length == 4:
+                if (first == 99 and buf[start + 1] == 97 and buf[start + 2] == 115
+                        and buf[start + 3] == 101):  # case
+                    count += 1
+            elif length == 5:
+                if (first == 119 and buf[start + 1] == 104 and buf[start + 2] == 105
+                        and buf[start + 3] == 108 and buf[start + 4] == 101):  # while
+                    count += 1
+                elif (first == 99 and buf[start + 1] == 97 and buf[start + 2] == 116
+                        and buf[start + 3] == 99 and buf[start + 4] == 104):  # catch
+                    count += 1
+        else:
+            i += 1
+    return count
+
+@maybe_njit(signature=BYTES_COUNTER_SIGNATURE)
+def css_rule_count(buf):
+    """Count non-overlapping matches of the CSS rule regex \\.[^{]+{[^}]+}"""
+    count = 0
+    n = len(buf)
+    i = 0
+    while i < n:
+        if buf[i] != 46:  # .
+            i += 1
+            continue
+        # The selector runs to the first '{' and the body to the first '}' after it
+        open_at = i + 1
+        while open_at < n and buf[open_at] != 123:  # {
+            open_at += 1
+        if open_at == n:
+            break  # No '{' left, so no later dot can match either
+        if open_at == i + 1:
+            i += 1  # Empty selector
+            continue
+        close_at = open_at + 1
+        while close_at < n and buf[close_at] != 125:  # }
+            close_at += 1
+        if close_at == n:
+            break
+        if close_at == open_at + 1:
+            # Empty body: every dot before this '{' would reach it too
+            i = close_at + 1
+            continue
+        count += 1
+        i = close_at + 1
+    return count
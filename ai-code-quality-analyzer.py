@@ -5,18 +5,39 @@ Advanced code analysis tool with ML-based quality assessment and optimization su
 """
 
 import ast
+import bisect
+import hashlib
+import io
 import json
 import os
 import subprocess
 import sys
 import time
 import re
+import tokenize
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import subprocess
 import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Per-project cache of file results, keyed by path + mtime + size
+CACHE_FILE = ".aicqa_cache.json"
+CACHE_VERSION = 2
+
+# Below this many uncached files, worker start-up costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Line-based style rules, matched over the whole file instead of per split line
+LONG_LINE_PATTERN = re.compile(r'^.{89,}$', re.MULTILINE)  # Black formatter default
+TRAILING_WHITESPACE_PATTERN = re.compile(r' $', re.MULTILINE)
+TODO_PATTERN = re.compile(r'^.*?(?:TODO|FIXME)', re.MULTILINE)
+NEWLINE_PATTERN = re.compile(r'\n')
+
+# Python keywords counted as decision points by _calculate_complexity
+PYTHON_BRANCH_KEYWORDS = frozenset({'if', 'elif', 'while', 'for', 'except', 'with'})
 
 @dataclass
 class CodeIssue:
@@ -29,6 +50,14 @@ class CodeIssue:
     rule_violated: Optional[str] = None
     confidence: float = 1.0
 
+def compute_sizes(node: ast.AST) -> int:
+    """Annotate every node with its subtree size (node._size) in one post-order pass"""
+    size = 1
+    for child in ast.iter_child_nodes(node):
+        size += compute_sizes(child)
+    node._size = size
+    return size
+
 @dataclass
 class FileMetrics:
     file_path: str
@@ -43,11 +72,22 @@ class FileMetrics:
 class AICodeQualityAnalyzer:
     """AI-powered code quality analysis with ML insights"""
     
-    def __init__(self, project_path: str = "."):
+    def __init__(self, project_path: str = ".", use_cache: bool = True, jobs: Optional[int] = None):
         self.project_path = Path(project_path)
+        self.jobs = jobs or os.cpu_count() or 1
         self.issues: List[CodeIssue] = []
         self.file_metrics: List[FileMetrics] = []
         
+        # Results from previous runs; only entries seen this run are written back
+        self.use_cache = use_cache
+        self.cache_path = self.project_path / CACHE_FILE
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache() if use_cache else {}
+        self._new_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Running per-file counts, maintained by _emit
+        self._per_file_sec: Dict[str, int] = {}
+        self._per_file_perf: Dict[str, int] = {}
+        
         # Quality thresholds
         self.thresholds = {
             "maintainability_index": {
@@ -81,15 +121,19 @@ class AICodeQualityAnalyzer:
         print(f"📁 Found {len(code_files)} code files to analyze")
         
         # Analyze each file
-        for file_path in code_files:
-            print(f"🔬 Analyzing: {file_path}")
-            self._analyze_file(file_path)
+        self._analyze_files(code_files)
+        
+        if self.use_cache:
+            self._save_cache()
+        
+        # Reduce all per-file metric columns once, shared by the summaries below
+        metric_sums = self._sum_file_metrics()
         
         # Generate project metrics
-        project_metrics = self._calculate_project_metrics()
+        project_metrics = self._calculate_project_metrics(metric_sums)
         
         # Generate AI-powered recommendations
-        recommendations = self._generate_ai_recommendations()
+        recommendations = self._generate_ai_recommendations(metric_sums)
         
         analysis_time = time.time() - start_time
         
@@ -104,7 +148,7 @@ class AICodeQualityAnalyzer:
             "file_metrics": [asdict(m) for m in self.file_metrics],
             "issues": [asdict(i) for i in self.issues],
             "ai_recommendations": recommendations,
-            "quality_score": self._calculate_quality_score()
+            "quality_score": self._calculate_quality_score(metric_sums)
         }
         
         return report
@@ -123,27 +167,118 @@ class AICodeQualityAnalyzer:
         
         return code_files
     
-    def _analyze_file(self, file_path: Path):
-        """Analyze a single code file"""
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached per-file results from a previous run"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("entries", {})
+    
+    def _save_cache(self):
+        """Atomically write this run's per-file results"""
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": CACHE_VERSION, "entries": self._new_cache}, f, sort_keys=True)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not write cache {self.cache_path}: {e}")
+    
+    def _cache_key(self, file_path: Path) -> str:
+        """Fingerprint a file by path, modification time and size"""
+        st = file_path.stat()
+        key = f"{file_path}:{st.st_mtime_ns}:{st.st_size}"
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _analyze_files(self, code_files: List[Path]):
+        """Analyze files, restoring cached results and fanning the rest out to workers"""
+        pending = []
+        for file_path in code_files:
+            print(f"🔬 Analyzing: {file_path}")
+            try:
+                key = self._cache_key(file_path)
+            except OSError:
+                key = None
+            if not self._restore_cached(key, file_path):
+                pending.append((file_path, key))
+        
+        if self.jobs <= 1 or len(pending) < PARALLEL_MIN_FILES:
+            for file_path, key in pending:
+                self._analyze_file(file_path, key)
+            return
+        
+        # Threads only pay off when the GIL is disabled (free-threaded 3.13+ builds)
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        executor_class = ProcessPoolExecutor if gil_enabled else ThreadPoolExecutor
+        
+        with executor_class(max_workers=min(self.jobs, len(pending))) as executor:
+            results = executor.map(_analyze_file_worker, [file_path for file_path, _ in pending])
+            for (file_path, key), (analyzed, file_metrics, issues) in zip(pending, results):
+                self.file_metrics.extend(file_metrics)
+                self.issues.extend(issues)
+                if analyzed and key:
+                    self._new_cache[key] = self._cache_entry(file_metrics, issues)
+    
+    def _restore_cached(self, key: Optional[str], file_path: Path) -> bool:
+        """Reuse a previous run's results for an unchanged file"""
+        cached = self._cache.get(key) if key else None
+        if cached is None:
+            return False
+        
+        self._new_cache[key] = cached
+        self.issues.extend(CodeIssue(**i) for i in cached["issues"])
+        if cached["metrics"] is not None:
+            file_metrics = FileMetrics(**cached["metrics"])
+            # Coverage depends on neighbouring test files, which may have changed
+            file_metrics.test_coverage = self._estimate_test_coverage(file_path)
+            self.file_metrics.append(file_metrics)
+        return True
+    
+    def _cache_entry(self, file_metrics: List[FileMetrics], issues: List[CodeIssue]) -> Dict[str, Any]:
+        """Serialize one file's results for the cache"""
+        return {
+            "metrics": asdict(file_metrics[0]) if file_metrics else None,
+            "issues": [asdict(i) for i in issues]
+        }
+    
+    def _analyze_file(self, file_path: Path, key: Optional[str] = None):
+        """Analyze a single code file and record its results under key"""
+        issues_start = len(self.issues)
+        metrics_start = len(self.file_metrics)
+        if self._run_file_analysis(file_path) and key:
+            self._new_cache[key] = self._cache_entry(
+                self.file_metrics[metrics_start:], self.issues[issues_start:]
+            )
+    
+    def _run_file_analysis(self, file_path: Path) -> bool:
+        """Analyze a single code file, returning False if it could not be analyzed"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
             # Skip empty files
             if not content.strip():
-                return
+                return True
             
             # Calculate basic metrics
             lines_of_code = len([line for line in content.splitlines() if line.strip()])
             complexity_score = self._calculate_complexity(content, file_path.suffix)
             
+            # Stringify the path once; every CodeIssue for this file reuses it
+            file_path_str = str(file_path)
+            
             # Run static analysis based on file type
             if file_path.suffix == '.py':
-                self._analyze_python_file(file_path, content)
+                self._analyze_python_file(file_path_str, content)
             elif file_path.suffix in ['.js', '.ts', '.jsx', '.tsx']:
-                self._analyze_javascript_file(file_path, content)
+                self._analyze_javascript_file(file_path_str, content)
             elif file_path.suffix == '.go':
-                self._analyze_go_file(file_path, content)
+                self._analyze_go_file(file_path_str, content)
             
             # Calculate maintainability index
             maintainability_index = self._calculate_maintainability_index(
@@ -158,35 +293,47 @@ class AICodeQualityAnalyzer:
             
             # Create file metrics
             file_metrics = FileMetrics(
-                file_path=str(file_path),
+                file_path=file_path_str,
                 lines_of_code=lines_of_code,
                 complexity_score=complexity_score,
                 maintainability_index=maintainability_index,
                 test_coverage=test_coverage,
                 duplication_percentage=duplication_percentage,
-                security_issues=len([i for i in self.issues if i.file_path == str(file_path) and 'security' in i.issue_type.lower()]),
-                performance_issues=len([i for i in self.issues if i.file_path == str(file_path) and 'performance' in i.issue_type.lower()])
+                security_issues=self._per_file_sec.get(file_path_str, 0),
+                performance_issues=self._per_file_perf.get(file_path_str, 0)
             )
             
             self.file_metrics.append(file_metrics)
+            return True
             
         except Exception as e:
             print(f"❌ Error analyzing {file_path}: {e}")
+            return False
+    
+    def _emit(self, issue: CodeIssue):
+        """Record an issue and update the per-file security/performance counts"""
+        self.issues.append(issue)
+        if issue.issue_type == "security":
+            self._per_file_sec[issue.file_path] = self._per_file_sec.get(issue.file_path, 0) + 1
+        elif issue.issue_type == "performance":
+            self._per_file_perf[issue.file_path] = self._per_file_perf.get(issue.file_path, 0) + 1
     
-    def _analyze_python_file(self, file_path: Path, content: str):
+    def _analyze_python_file(self, file_path_str: str, content: str):
         """Analyze Python file for issues"""
         try:
-            tree = ast.parse(content)
+            # Same as ast.parse, but without inheriting this module's compiler flags
+            tree = compile(content, file_path_str, 'exec', flags=ast.PyCF_ONLY_AST,
+                           dont_inherit=True, optimize=0)
             
             # Check for various issues
-            self._check_python_security_issues(tree, file_path)
-            self._check_python_performance_issues(tree, file_path)
-            self._check_python_style_issues(content, file_path)
-            self._check_python_complexity(tree, file_path)
+            self._check_python_security_issues(tree, file_path_str)
+            self._check_python_performance_issues(tree, file_path_str)
+            self._check_python_style_issues(content, file_path_str)
+            self._check_python_complexity(tree, file_path_str)
             
         except SyntaxError as e:
-            self.issues.append(CodeIssue(
-                file_path=str(file_path),
+            self._emit(CodeIssue(
+                file_path=file_path_str,
                 line_number=e.lineno or 1,
                 issue_type="syntax",
                 severity="critical",
@@ -194,20 +341,20 @@ class AICodeQualityAnalyzer:
                 suggestion="Fix syntax errors before proceeding"
             ))
     
-    def _check_python_security_issues(self, tree: ast.AST, file_path: Path):
+    def _check_python_security_issues(self, tree: ast.AST, file_path_str: str):
         """Check for common Python security issues"""
         class SecurityVisitor(ast.NodeVisitor):
             def __init__(self, analyzer):
                 self.analyzer = analyzer
-                self.file_path = file_path
+                self.file_path_str = file_path_str
             
             def visit_Import(self, node):
                 # Check for dangerous imports
                 dangerous_modules = ['pickle', 'cPickle', 'subprocess', 'os']
                 for alias in node.names:
                     if alias.name in dangerous_modules:
-                        self.analyzer.issues.append(CodeIssue(
-                            file_path=str(self.file_path),
+                        self.analyzer._emit(CodeIssue(
+                            file_path=self.file_path_str,
                             line_number=node.lineno,
                             issue_type="security",
                             severity="medium",
@@ -221,8 +368,8 @@ class AICodeQualityAnalyzer:
                 if isinstance(node.func, ast.Name):
                     dangerous_calls = ['eval', 'exec', 'compile']
                     if node.func.id in dangerous_calls:
-                        self.analyzer.issues.append(CodeIssue(
-                            file_path=str(self.file_path),
+                        self.analyzer._emit(CodeIssue(
+                            file_path=self.file_path_str,
                             line_number=node.lineno,
                             issue_type="security",
                             severity="high",
@@ -234,19 +381,19 @@ class AICodeQualityAnalyzer:
         visitor = SecurityVisitor(self)
         visitor.visit(tree)
     
-    def _check_python_performance_issues(self, tree: ast.AST, file_path: Path):
+    def _check_python_performance_issues(self, tree: ast.AST, file_path_str: str):
         """Check for Python performance issues"""
         class PerformanceVisitor(ast.NodeVisitor):
             def __init__(self, analyzer):
                 self.analyzer = analyzer
-                self.file_path = file_path
+                self.file_path_str = file_path_str
             
             def visit_For(self, node):
                 # Check for nested loops (potential performance issue)
                 nested_loops = sum(1 for child in ast.walk(node) if isinstance(child, ast.For))
                 if nested_loops > 2:
-                    self.analyzer.issues.append(CodeIssue(
-                        file_path=str(self.file_path),
+                    self.analyzer._emit(CodeIssue(
+                        file_path=self.file_path_str,
                         line_number=node.lineno,
                         issue_type="performance",
                         severity="medium",
@@ -256,10 +403,10 @@ class AICodeQualityAnalyzer:
                 self.generic_visit(node)
             
             def visit_ListComp(self, node):
-                # Check for complex list comprehensions
-                if len(list(ast.walk(node))) > 10:
-                    self.analyzer.issues.append(CodeIssue(
-                        file_path=str(self.file_path),
+                # Check for complex list comprehensions (sizes precomputed by compute_sizes)
+                if node._size > 10:
+                    self.analyzer._emit(CodeIssue(
+                        file_path=self.file_path_str,
                         line_number=node.lineno,
                         issue_type="performance",
                         severity="low",
@@ -268,30 +415,44 @@ class AICodeQualityAnalyzer:
                     ))
                 self.generic_visit(node)
         
+        compute_sizes(tree)
         visitor = PerformanceVisitor(self)
         visitor.visit(tree)
     
-    def _check_python_style_issues(self, content: str, file_path: Path):
+    def _check_python_style_issues(self, content: str, file_path_str: str):
         """Check for Python style issues"""
-        lines = content.splitlines()
+        # (match offset, rule order, issue kind, long line length); rule order keeps
+        # issues on the same line reported as length, whitespace, then TODO
+        matches = [(m.start(), 0, "long_line", len(m.group())) for m in LONG_LINE_PATTERN.finditer(content)]
+        matches.extend((m.start(), 1, "trailing_whitespace", 0) for m in TRAILING_WHITESPACE_PATTERN.finditer(content))
+        matches.extend((m.start(), 2, "todo", 0) for m in TODO_PATTERN.finditer(content))
+        if not matches:
+            return
+        
+        line_starts = [0]
+        line_starts.extend(m.end() for m in NEWLINE_PATTERN.finditer(content))
+        found = sorted(
+            (bisect.bisect_right(line_starts, offset), order, kind, length)
+            for offset, order, kind, length in matches
+        )
         
-        for i, line in enumerate(lines, 1):
+        for line_number, _, kind, length in found:
             # Check line length
-            if len(line) > 88:  # Black formatter default
-                self.issues.append(CodeIssue(
-                    file_path=str(file_path),
-                    line_number=i,
+            if kind == "long_line":
+                self._emit(CodeIssue(
+                    file_path=file_path_str,
+                    line_number=line_number,
                     issue_type="style",
                     severity="low",
-                    message=f"Line too long ({len(line)} characters)",
+                    message=f"Line too long ({length} characters)",
                     suggestion="Break long lines or use string concatenation"
                 ))
             
             # Check for trailing whitespace
-            if line.endswith(' '):
-                self.issues.append(CodeIssue(
-                    file_path=str(file_path),
-                    line_number=i,
+            elif kind == "trailing_whitespace":
+                self._emit(CodeIssue(
+                    file_path=file_path_str,
+                    line_number=line_number,
                     issue_type="style",
                     severity="low",
                     message="Trailing whitespace",
@@ -299,17 +460,17 @@ class AICodeQualityAnalyzer:
                 ))
             
             # Check for TODO/FIXME comments
-            if 'TODO' in line or 'FIXME' in line:
-                self.issues.append(CodeIssue(
-                    file_path=str(file_path),
-                    line_number=i,
+            else:
+                self._emit(CodeIssue(
+                    file_path=file_path_str,
+                    line_number=line_number,
                     issue_type="maintenance",
                     severity="medium",
                     message="Unresolved TODO/FIXME found",
                     suggestion="Address the TODO or convert to proper issue tracking"
                 ))
     
-    def _check_python_complexity(self, tree: ast.AST, file_path: Path):
+    def _check_python_complexity(self, tree: ast.AST, file_path_str: str):
         """Check Python code complexity"""
         class ComplexityVisitor(ast.NodeVisitor):
             def __init__(self):
@@ -335,8 +496,8 @@ class AICodeQualityAnalyzer:
         visitor.visit(tree)
         
         if visitor.complexity > 15:
-            self.issues.append(CodeIssue(
-                file_path=str(file_path),
+            self._emit(CodeIssue(
+                file_path=file_path_str,
                 line_number=1,
                 issue_type="complexity",
                 severity="medium",
@@ -344,15 +505,15 @@ class AICodeQualityAnalyzer:
                 suggestion="Consider breaking function into smaller pieces"
             ))
     
-    def _analyze_javascript_file(self, file_path: Path, content: str):
+    def _analyze_javascript_file(self, file_path_str: str, content: str):
         """Analyze JavaScript/TypeScript file for issues"""
         lines = content.splitlines()
         
         for i, line in enumerate(lines, 1):
             # Check for console.log statements
             if 'console.log' in line:
-                self.issues.append(CodeIssue(
-                    file_path=str(file_path),
+                self._emit(CodeIssue(
+                    file_path=file_path_str,
                     line_number=i,
                     issue_type="maintenance",
                     severity="low",
@@ -362,8 +523,8 @@ class AICodeQualityAnalyzer:
             
             # Check for var usage (use let/const instead)
             if re.match(r'^\s*var\s+', line):
-                self.issues.append(CodeIssue(
-                    file_path=str(file_path),
+                self._emit(CodeIssue(
+                    file_path=file_path_str,
                     line_number=i,
                     issue_type="style",
                     severity="medium",
@@ -373,8 +534,8 @@ class AICodeQualityAnalyzer:
             
             # Check for == vs ===
             if '==' in line and '===' not in line and '!=' in line and '!==' not in line:
-                self.issues.append(CodeIssue(
-                    file_path=str(file_path),
+                self._emit(CodeIssue(
+                    file_path=file_path_str,
                     line_number=i,
                     issue_type="quality",
                     severity="medium",
@@ -382,28 +543,28 @@ class AICodeQualityAnalyzer:
                     suggestion="Use === and !== for strict equality comparison"
                 ))
     
-    def _analyze_go_file(self, file_path: Path, content: str):
+    def _analyze_go_file(self, file_path_str: str, content: str):
         """Analyze Go file for issues"""
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines, 1):
-            # Check for error handling
-            if ('err :=' in line or 'err, :=' in line) and i < len(lines) - 1:
-                next_line = lines[i]
-                if 'if err != nil' not in next_line:
-                    self.issues.append(CodeIssue(
-                        file_path=str(file_path),
-                        line_number=i,
-                        issue_type="quality",
-                        severity="high",
-                        message="Potential unhandled error",
-                        suggestion="Always handle errors in Go"
-                    ))
+        # Rolling window over (previous line, current line) instead of indexing into a list
+        prev_assigns_err = False
+        
+        for i, line in enumerate(content.splitlines(), 1):
+            # Check for error handling on the line after an err assignment
+            if prev_assigns_err and 'if err != nil' not in line:
+                self._emit(CodeIssue(
+                    file_path=file_path_str,
+                    line_number=i - 1,
+                    issue_type="quality",
+                    severity="high",
+                    message="Potential unhandled error",
+                    suggestion="Always handle errors in Go"
+                ))
+            prev_assigns_err = 'err :=' in line or 'err, :=' in line
             
             # Check for TODO comments
             if 'TODO' in line or 'FIXME' in line:
-                self.issues.append(CodeIssue(
-                    file_path=str(file_path),
+                self._emit(CodeIssue(
+                    file_path=file_path_str,
                     line_number=i,
                     issue_type="maintenance",
                     severity="medium",
@@ -413,6 +574,17 @@ class AICodeQualityAnalyzer:
     
     def _calculate_complexity(self, content: str, file_extension: str) -> int:
         """Calculate cyclomatic complexity"""
+        if file_extension == '.py':
+            # Count real keyword tokens in one pass, ignoring strings and comments
+            try:
+                tokens = tokenize.generate_tokens(io.StringIO(content).readline)
+                return 1 + sum(
+                    1 for tok in tokens
+                    if tok.type == tokenize.NAME and tok.string in PYTHON_BRANCH_KEYWORDS
+                )
+            except (tokenize.TokenError, SyntaxError):
+                pass  # Untokenizable source, fall back to the regex count below
+        
         # Simple complexity calculation based on control structures
         complexity_indicators = {
             '.py': [r'\bif\b', r'\belif\b', r'\bwhile\b', r'\bfor\b', r'\bexcept\b', r'\bwith\b'],
@@ -487,17 +659,40 @@ class AICodeQualityAnalyzer:
         
         return breakdown
     
-    def _calculate_project_metrics(self) -> Dict[str, Any]:
+    def _sum_file_metrics(self) -> Dict[str, float]:
+        """Sum the numeric file metric columns, vectorized with NumPy when available"""
+        columns = ("lines_of_code", "complexity_score", "maintainability_index",
+                   "test_coverage", "security_issues", "performance_issues")
+        rows = [
+            (m.lines_of_code, m.complexity_score, m.maintainability_index,
+             m.test_coverage, m.security_issues, m.performance_issues)
+            for m in self.file_metrics
+        ]
+        if not rows:
+            return dict.fromkeys(columns, 0)
+        
+        try:
+            import numpy as np
+        except ImportError:
+            sums = [sum(column) for column in zip(*rows)]
+        else:
+            sums = np.array(rows, dtype=np.float64).sum(axis=0).tolist()
+        
+        return dict(zip(columns, sums))
+    
+    def _calculate_project_metrics(self, metric_sums: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """Calculate overall project metrics"""
         if not self.file_metrics:
             return {}
         
-        total_loc = sum(m.lines_of_code for m in self.file_metrics)
-        avg_complexity = sum(m.complexity_score for m in self.file_metrics) / len(self.file_metrics)
-        avg_maintainability = sum(m.maintainability_index for m in self.file_metrics) / len(self.file_metrics)
-        avg_test_coverage = sum(m.test_coverage for m in self.file_metrics) / len(self.file_metrics)
-        total_security_issues = sum(m.security_issues for m in self.file_metrics)
-        total_performance_issues = sum(m.performance_issues for m in self.file_metrics)
+        sums = metric_sums or self._sum_file_metrics()
+        file_count = len(self.file_metrics)
+        total_loc = int(sums["lines_of_code"])
+        avg_complexity = sums["complexity_score"] / file_count
+        avg_maintainability = sums["maintainability_index"] / file_count
+        avg_test_coverage = sums["test_coverage"] / file_count
+        total_security_issues = int(sums["security_issues"])
+        total_performance_issues = int(sums["performance_issues"])
         
         return {
             "total_lines_of_code": total_loc,
@@ -520,7 +715,7 @@ class AICodeQualityAnalyzer:
         else:
             return "D"
     
-    def _calculate_quality_score(self) -> float:
+    def _calculate_quality_score(self, metric_sums: Optional[Dict[str, float]] = None) -> float:
         """Calculate overall quality score (0-100)"""
         if not self.file_metrics:
             return 0.0
@@ -535,11 +730,13 @@ class AICodeQualityAnalyzer:
         }
         
         # Calculate scores
-        avg_maintainability = sum(m.maintainability_index for m in self.file_metrics) / len(self.file_metrics)
-        avg_complexity = sum(m.complexity_score for m in self.file_metrics) / len(self.file_metrics)
-        avg_test_coverage = sum(m.test_coverage for m in self.file_metrics) / len(self.file_metrics)
-        total_security_issues = sum(m.security_issues for m in self.file_metrics)
-        total_performance_issues = sum(m.performance_issues for m in self.file_metrics)
+        sums = metric_sums or self._sum_file_metrics()
+        file_count = len(self.file_metrics)
+        avg_maintainability = sums["maintainability_index"] / file_count
+        avg_complexity = sums["complexity_score"] / file_count
+        avg_test_coverage = sums["test_coverage"] / file_count
+        total_security_issues = sums["security_issues"]
+        total_performance_issues = sums["performance_issues"]
         
         # Normalize scores
         maintainability_score = min(avg_maintainability, 100)
@@ -559,7 +756,7 @@ class AICodeQualityAnalyzer:
         
         return round(quality_score, 1)
     
-    def _generate_ai_recommendations(self) -> List[Dict[str, Any]]:
+    def _generate_ai_recommendations(self, metric_sums: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
         """Generate AI-powered improvement recommendations"""
         recommendations = []
         
@@ -590,8 +787,10 @@ class AICodeQualityAnalyzer:
                 "ai_confidence": 0.85
             })
         
+        sums = metric_sums or self._sum_file_metrics()
+        
         # Test coverage recommendations
-        avg_coverage = sum(m.test_coverage for m in self.file_metrics) / len(self.file_metrics)
+        avg_coverage = sums["test_coverage"] / len(self.file_metrics)
         if avg_coverage < 60:
             recommendations.append({
                 "priority": "medium",
@@ -603,7 +802,7 @@ class AICodeQualityAnalyzer:
             })
         
         # Maintainability recommendations
-        avg_maintainability = sum(m.maintainability_index for m in self.file_metrics) / len(self.file_metrics)
+        avg_maintainability = sums["maintainability_index"] / len(self.file_metrics)
         if avg_maintainability < 70:
             recommendations.append({
                 "priority": "medium",
@@ -616,6 +815,12 @@ class AICodeQualityAnalyzer:
         
         return recommendations
 
+def _analyze_file_worker(file_path: Path) -> Tuple[bool, List[FileMetrics], List[CodeIssue]]:
+    """Analyze one file in a pool worker with a fresh, cache-less analyzer"""
+    analyzer = AICodeQualityAnalyzer(str(file_path.parent), use_cache=False, jobs=1)
+    analyzed = analyzer._run_file_analysis(file_path)
+    return analyzed, analyzer.file_metrics, analyzer.issues
+
 def main():
     """Main function to run code quality analysis"""
     import argparse
@@ -624,10 +829,12 @@ def main():
     parser.add_argument("path", nargs="?", default=".", help="Path to project directory")
     parser.add_argument("--output", "-o", help="Output JSON file")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore and don't write {CACHE_FILE}")
+    parser.add_argument("--jobs", "-j", type=int, help="Parallel workers (default: CPU count)")
     
     args = parser.parse_args()
     
-    analyzer = AICodeQualityAnalyzer(args.path)
+    analyzer = AICodeQualityAnalyzer(args.path, use_cache=not args.no_cache, jobs=args.jobs)
     report = analyzer.analyze_project()
     
     if args.output:
@@ -17,8 +17,10 @@ import subprocess
 import re
 import requests
 from urllib.parse import urljoin, urlparse
-import ast
 import hashlib
+import mmap
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +32,64 @@ logging.basicConfig(
     ]
 )
 
+# Content analysis patterns, compiled once as bytes patterns (file bodies are read
+# undecoded). Dead code kinds are fused into one alternation so each file is scanned
+# once; the matching group name is reported as the dead code type.
+DEAD_CODE_PATTERN = re.compile(
+    rb'(?P<console>console\.(?:log|debug|info|warn|error))'
+    rb'|(?P<debugger>debugger)'
+    rb'|(?P<todo>(?://|/\*)[^\n]*?(?:TODO|FIXME))',
+    re.IGNORECASE
+)
+DEAD_CODE_TYPES = ("console", "debugger", "todo")
+
+# Unused CSS patterns (heuristic)
+UNUSED_CSS_PATTERNS = [
+    (re.compile(pattern.encode()), pattern) for pattern in (
+        r'\.unused',
+        r'\.test',
+        r'\.debug',
+        r'\.temp'
+    )
+]
+
+CSS_RULE_PATTERN = re.compile(rb'\.[^{]+{[^}]+}')
+
+# Per-target cache of file analyses, keyed by path + size + mtime
+CACHE_FILE = ".autoopt-cache.json"
+CACHE_VERSION = 4
+
+# File bucket for each scanned suffix
+SUFFIX_BUCKETS = {
+    '.js': 'javascript', '.mjs': 'javascript', '.jsx': 'javascript', '.ts': 'javascript',
+    '.css': 'css', '.scss': 'css', '.sass': 'css', '.less': 'css',
+    '.jpg': 'images', '.jpeg': 'images', '.png': 'images', '.gif': 'images', '.webp': 'images', '.svg': 'images',
+    '.html': 'html', '.htm': 'html',
+    '.json': 'config_files', '.yaml': 'config_files', '.yml': 'config_files', '.toml': 'config_files'
+}
+
+# Buckets whose files are analyzed, so their scan-time stat is kept
+ANALYZED_BUCKETS = frozenset(('javascript', 'css', 'images'))
+
+# Image formats worth converting to WebP; codes are 1-based indexes (0 = other)
+IMAGE_FORMATS = ('.jpg', '.jpeg', '.png')
+IMAGE_FORMAT_CODES = {file_ext: code for code, file_ext in enumerate(IMAGE_FORMATS, 1)}
+
+# Sources above this size are memory-mapped rather than copied into memory
+MMAP_THRESHOLD = 1024 * 1024
+
+# Files read ahead on I/O threads while the current one is analyzed
+READ_AHEAD_DEPTH = 16
+
+# Leading bytes sniffed to spot binary blobs and minified bundles before regex analysis
+SNIFF_BYTES = 4096
+
+# Below this many files, analyze serially rather than pay process pool startup
+PARALLEL_MIN_FILES = 8
+
+# JavaScript decision points: branching keywords and short-circuit operators
+JS_COMPLEXITY_PATTERN = re.compile(rb'\b(?:if|for|while|case|catch)\b|&&|\|\|')
+
 class AIPerformanceAutoOptimizer:
     """AI-powered performance auto-optimizer with self-healing capabilities"""
     
@@ -40,6 +100,17 @@ class AIPerformanceAutoOptimizer:
         self.performance_metrics = {}
         self.ai_suggestions = []
         
+        # Loaded by scan_target so config["use_cache"] can still be changed after init
+        self.cache_path = self.target_path / CACHE_FILE
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._new_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # stat results captured while scanning, reused for sizes and cache keys
+        self._file_stats: Dict[str, os.stat_result] = {}
+        
+        # Per-file analysis failures by exception type, reported once per scan
+        self._errors: Counter = Counter()
+        
     def load_config(self, config_path: str) -> dict:
         """Load configuration from file or create default"""
         default_config = {
@@ -47,6 +118,7 @@ class AIPerformanceAutoOptimizer:
             "backup_files": True,
             "auto_apply": True,
             "verify_changes": True,
+            "use_cache": True,
             "focus_areas": [
                 "javascript_optimization",
                 "css_optimization", 
@@ -73,6 +145,12 @@ class AIPerformanceAutoOptimizer:
         """Comprehensive scan of target directory for optimization opportunities"""
         logging.info(f"🔍 Scanning target directory: {self.target_path}")
         
+        use_cache = self.config.get("use_cache", True)
+        self._cache = self._load_cache() if use_cache else {}
+        self._new_cache = {}
+        self._file_stats = {}
+        self._errors = Counter()
+        
         scan_results = {
             "files": {
                 "javascript": [],
@@ -86,21 +164,15 @@ class AIPerformanceAutoOptimizer:
             "performance_issues": []
         }
         
-        # Scan for files
-        for file_path in self.target_path.rglob("*"):
-            if file_path.is_file():
-                suffix = file_path.suffix.lower()
-                
-                if suffix in ['.js', '.mjs', '.jsx', '.ts']:
-                    scan_results["files"]["javascript"].append(str(file_path))
-                elif suffix in ['.css', '.scss', '.sass', '.less']:
-                    scan_results["files"]["css"].append(str(file_path))
-                elif suffix in ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg']:
-                    scan_results["files"]["images"].append(str(file_path))
-                elif suffix in ['.html', '.htm']:
-                    scan_results["files"]["html"].append(str(file_path))
-                elif suffix in ['.json', '.yaml', '.yml', 'toml']:
-                    scan_results["files"]["config_files"].append(str(file_path))
+        # Scan for files, classifying on the directory entry name without building Paths
+        for entry in _walk_files(str(self.target_path)):
+            if entry.name == CACHE_FILE:
+                continue
+            bucket = SUFFIX_BUCKETS.get(os.path.splitext(entry.name)[1].lower())
+            if bucket:
+                scan_results["files"][bucket].append(entry.path)
+                if bucket in ANALYZED_BUCKETS:
+                    self._record_stat(entry)
         
         # Detect technologies and frameworks
         self.detect_technologies(scan_results)
@@ -108,8 +180,22 @@ class AIPerformanceAutoOptimizer:
         # Analyze optimization potential
         self.analyze_optimization_potential(scan_results)
         
+        if self._errors:
+            logging.warning("Skipped %d files: %s", sum(self._errors.values()),
+                            dict(self._errors.most_common(5)))
+        
+        if use_cache:
+            self._save_cache()
+        
         return scan_results
     
+    def _record_stat(self, entry: os.DirEntry):
+        """Keep the entry's stat so analysis doesn't stat the file again"""
+        try:
+            self._file_stats[entry.path] = entry.stat()
+        except OSError:
+            pass  # Analysis falls back to its own stat and reports the error
+    
     def detect_technologies(self, scan_results: Dict[str, Any]):
         """Detect technologies and frameworks used in the project"""
         tech_indicators = {
@@ -125,10 +211,18 @@ class AIPerformanceAutoOptimizer:
             "express": ["package.json", "app.js", "server.js"]
         }
         
+        candidates = scan_results["files"]["config_files"] + scan_results["files"]["javascript"]
+        basenames = {os.path.basename(file) for file in candidates}
+        full_paths = tuple(file.replace(os.sep, '/') for file in candidates)
+        
         for tech, indicators in tech_indicators.items():
             for indicator in indicators:
-                if any(indicator in file for file in scan_results["files"]["config_files"] + 
-                      scan_results["files"]["javascript"]):
+                # Bare file names are a set lookup; only nested indicators scan paths
+                if '/' in indicator:
+                    found = any(path.endswith('/' + indicator) for path in full_paths)
+                else:
+                    found = indicator in basenames
+                if found:
                     scan_results["technologies"].add(tech)
                     break
     
@@ -158,28 +252,10 @@ class AIPerformanceAutoOptimizer:
     
     def analyze_javascript_files(self, js_files: List[str]) -> Dict[str, Any]:
         """AI analysis of JavaScript files for optimization opportunities"""
-        analysis = {
-            "total_files": len(js_files),
-            "total_size": 0,
-            "optimization_opportunities": [],
-            "complexity_score": 0,
-            "dead_code_detected": [],
-            "bundle_optimization_potential": 0
-        }
+        analysis = {"total_files": len(js_files), **_empty_js_analysis()}
         
-        for file_path in js_files:
-            try:
-                file_size = os.path.getsize(file_path)
-                analysis["total_size"] += file_size
-                
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                # AI-powered code analysis
-                self.ai_analyze_javascript_content(file_path, content, analysis)
-                    
-            except Exception as e:
-                logging.warning(f"Could not analyze {file_path}: {e}")
+        # Regex-bound work, so use processes rather than threads
+        self._run_file_workers(_analyze_one_js, js_files, analysis, cacheable=True)
         
         # Calculate optimization potential
         analysis["optimization_potential_mb"] = round(analysis["total_size"] / 1024 / 1024, 2)
@@ -187,36 +263,26 @@ class AIPerformanceAutoOptimizer:
         
         return analysis
     
-    def ai_analyze_javascript_content(self, file_path: str, content: str, analysis: Dict[str, Any]):
+    @staticmethod
+    def ai_analyze_javascript_content(file_path: str, content: bytes, analysis: Dict[str, Any]):
         """AI-powered JavaScript content analysis"""
         
         # Complexity analysis
-        try:
-            tree = ast.parse(content)
-            complexity = self.calculate_complexity(tree)
-            analysis["complexity_score"] += complexity
-        except:
-            pass
+        analysis["complexity_score"] += _count_js_complexity(content)
         
         # Dead code detection patterns
-        dead_code_patterns = [
-            r'console\.(log|debug|info|warn|error)',
-            r'debugger',
-            r'//.*TODO|FIXME',
-            r'\/\*[\s\S]*?\*\/.*TODO|FIXME'
-        ]
-        
-        for pattern in dead_code_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
+        counts = Counter(match.lastgroup for match in DEAD_CODE_PATTERN.finditer(content))
+        for dead_code_type in DEAD_CODE_TYPES:
+            if counts[dead_code_type]:
                 analysis["dead_code_detected"].append({
                     "file": file_path,
-                    "type": pattern,
-                    "count": len(matches)
+                    "type": dead_code_type,
+                    "count": counts[dead_code_type]
                 })
         
         # Bundle optimization opportunities
-        if 'import' in content or 'require' in content:
+        # find() rather than `in`, which only tests single bytes on an mmap
+        if content.find(b'import') != -1 or content.find(b'require') != -1:
             analysis["bundle_optimization_potential"] += 1
         
         # Large file detection
@@ -228,58 +294,23 @@ class AIPerformanceAutoOptimizer:
                 "suggestion": "Consider code splitting or lazy loading"
             })
     
-    def calculate_complexity(self, node) -> int:
-        """Calculate cyclomatic complexity of AST node"""
-        complexity = 1
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.With)):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-        return complexity
-    
     def analyze_css_files(self, css_files: List[str]) -> Dict[str, Any]:
         """AI analysis of CSS files for optimization opportunities"""
-        analysis = {
-            "total_files": len(css_files),
-            "total_size": 0,
-            "unused_css_detected": [],
-            "optimization_opportunities": [],
-            "critical_css_potential": 0
-        }
+        analysis = {"total_files": len(css_files), **_empty_css_analysis()}
         
-        for file_path in css_files:
-            try:
-                file_size = os.path.getsize(file_path)
-                analysis["total_size"] += file_size
-                
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                self.ai_analyze_css_content(file_path, content, analysis)
-                    
-            except Exception as e:
-                logging.warning(f"Could not analyze {file_path}: {e}")
+        self._run_file_workers(_analyze_one_css, css_files, analysis, cacheable=True)
         
         analysis["optimization_potential_mb"] = round(analysis["total_size"] / 1024 / 1024, 2)
         
         return analysis
     
-    def ai_analyze_css_content(self, file_path: str, content: str, analysis: Dict[str, Any]):
+    @staticmethod
+    def ai_analyze_css_content(file_path: str, content: bytes, analysis: Dict[str, Any]):
         """AI-powered CSS content analysis"""
         
         # Unused CSS patterns (heuristic)
-        unused_patterns = [
-            r'\.unused',
-            r'\.test',
-            r'\.debug',
-            r'\.temp'
-        ]
-        
-        for pattern in unused_patterns:
-            matches = re.findall(pattern, content)
+        for regex, pattern in UNUSED_CSS_PATTERNS:
+            matches = regex.findall(content)
             if matches:
                 analysis["unused_css_detected"].append({
                     "file": file_path,
@@ -298,12 +329,12 @@ class AIPerformanceAutoOptimizer:
             })
         
         # Redundant rules detection
-        rules = re.findall(r'\.[^{]+{[^}]+}', content)
-        if len(rules) > 1000:
+        rules_count = _count_css_rules(content)
+        if rules_count > 1000:
             analysis["optimization_opportunities"].append({
                 "file": file_path,
                 "type": "css_bloat",
-                "rules_count": len(rules),
+                "rules_count": rules_count,
                 "suggestion": "Consider CSS purge and optimization"
             })
     
@@ -317,21 +348,35 @@ class AIPerformanceAutoOptimizer:
             "compression_potential_mb": 0
         }
         
+        # Metadata only: sizes come from the scan, so this is an in-memory sweep
+        paths, sizes = [], []
         for file_path in img_files:
-            try:
-                file_size = os.path.getsize(file_path)
-                analysis["total_size"] += file_size
-                
+            file_size = self._file_size(file_path)
+            if file_size is None:
+                try:
+                    file_size = os.path.getsize(file_path)
+                except OSError as e:
+                    self._errors[type(e).__name__] += 1
+                    continue
+            paths.append(file_path)
+            sizes.append(file_size)
+        
+        analysis["total_size"] = sum(sizes)
+        
+        try:
+            import numpy as np
+        except ImportError:
+            for file_path, file_size in zip(paths, sizes):
                 self.ai_analyze_image_content(file_path, file_size, analysis)
-                    
-            except Exception as e:
-                logging.warning(f"Could not analyze {file_path}: {e}")
+        else:
+            self.ai_analyze_image_batch(np, paths, sizes, analysis)
         
         analysis["optimization_potential_mb"] = round(analysis["compression_potential_mb"] / 1024 / 1024, 2)
         
         return analysis
     
-    def ai_analyze_image_content(self, file_path: str, file_size: int, analysis: Dict[str, Any]):
+    @staticmethod
+    def ai_analyze_image_content(file_path: str, file_size: int, analysis: Dict[str, Any]):
         """AI-powered image content analysis"""
         
         file_ext = Path(file_path).suffix.lower()
@@ -351,7 +396,7 @@ class AIPerformanceAutoOptimizer:
             })
         
         # Format recommendations
-        if file_ext in ['.jpg', '.jpeg', '.png']:
+        if file_ext in IMAGE_FORMATS:
             if file_ext not in analysis["format_recommendations"]:
                 analysis["format_recommendations"][file_ext] = 0
             analysis["format_recommendations"][file_ext] += 1
@@ -365,6 +410,144 @@ class AIPerformanceAutoOptimizer:
                     "suggestion": f"Convert {file_ext} to WebP for better compression"
                 })
     
+    @staticmethod
+    def ai_analyze_image_batch(np, paths: List[str], sizes: List[int], analysis: Dict[str, Any]):
+        """Vectorized ai_analyze_image_content over all images at once"""
+        if not paths:
+            return
+        
+        size_arr = np.array(sizes, dtype=np.int64)
+        format_codes = np.array(
+            [IMAGE_FORMAT_CODES.get(os.path.splitext(path)[1].lower(), 0) for path in paths],
+            dtype=np.uint8
+        )
+        
+        large = size_arr > 1024 * 1024  # 1MB+
+        convertible = format_codes > 0
+        reformat = convertible & (size_arr > 500 * 1024)  # 500KB+
+        
+        compression_ratio = 0.6  # Estimated 40% compression
+        analysis["compression_potential_mb"] += float((size_arr[large] * compression_ratio).sum())
+        
+        # Format counts, keyed in order of first appearance like the per-file path
+        codes, first_seen, counts = np.unique(format_codes[convertible], return_index=True, return_counts=True)
+        for order in np.argsort(first_seen):
+            file_ext = IMAGE_FORMATS[codes[order] - 1]
+            analysis["format_recommendations"][file_ext] = int(counts[order])
+        
+        # Only materialize report entries for the flagged subset
+        for index in np.flatnonzero(large | reformat):
+            file_path = paths[index]
+            file_size = sizes[index]
+            if large[index]:
+                potential_savings = file_size * compression_ratio
+                analysis["optimization_opportunities"].append({
+                    "file": file_path,
+                    "type": "large_image",
+                    "size_mb": round(file_size / 1024 / 1024, 2),
+                    "potential_savings_mb": round(potential_savings / 1024 / 1024, 2),
+                    "suggestion": "Compress and convert to WebP format"
+                })
+            if reformat[index]:
+                file_ext = IMAGE_FORMATS[format_codes[index] - 1]
+                analysis["optimization_opportunities"].append({
+                    "file": file_path,
+                    "type": "format_optimization",
+                    "current_format": file_ext,
+                    "recommended": "WebP",
+                    "suggestion": f"Convert {file_ext} to WebP for better compression"
+                })
+    
+    def _run_file_workers(self, worker, files: List[str], analysis: Dict[str, Any],
+                          cacheable: bool = False):
+        """Run a per-file worker over a pool and merge its partial results in file order"""
+        partials: List[Optional[Dict[str, Any]]] = [None] * len(files)
+        keys: List[Optional[str]] = [None] * len(files)
+        pending = []
+        
+        for index, file_path in enumerate(files):
+            if cacheable and self.config.get("use_cache", True):
+                keys[index] = self._cache_key(file_path)
+                cached = self._cache.get(keys[index])
+                if cached is not None:
+                    self._new_cache[keys[index]] = cached
+                    partials[index] = cached
+                    continue
+            pending.append(index)
+        
+        tasks = [(files[index], self._file_size(files[index])) for index in pending]
+        for index, partial in zip(pending, self._iter_file_results(worker, tasks)):
+            error = partial.pop("error", None)
+            if error:
+                self._errors[error] += 1
+            elif keys[index]:
+                self._new_cache[keys[index]] = partial
+            partials[index] = partial
+        
+        for partial in partials:
+            _merge_analysis(analysis, partial)
+    
+    def _iter_file_results(self, worker, tasks: List[Tuple[str, Optional[int]]]):
+        """Yield each task's partial analysis, in task order"""
+        if not tasks:
+            return
+        
+        cpus = os.cpu_count() or 1
+        if len(tasks) < PARALLEL_MIN_FILES:
+            for task in tasks:
+                yield worker(task)
+            return
+        
+        if cpus == 1:
+            # Processes add no parallelism on one core; overlap file reads with regex work instead
+            for task, contents in _read_ahead(tasks):
+                yield worker(task, read=lambda _path, contents=contents: contents.result())
+            return
+        
+        # About 8 batches per worker: few enough to amortize IPC, enough to balance load
+        chunksize = max(1, len(tasks) // (cpus * 8))
+        with ProcessPoolExecutor(max_workers=cpus) as executor:
+            yield from executor.map(worker, tasks, chunksize=chunksize)
+    
+    def _file_size(self, file_path: str) -> Optional[int]:
+        """Size captured during the scan, if any"""
+        st = self._file_stats.get(file_path)
+        return st.st_size if st else None
+    
+    def _cache_key(self, file_path: str) -> Optional[str]:
+        """Fingerprint a file by path, size and modification time"""
+        st = self._file_stats.get(file_path)
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return None
+        key = f"{file_path}:{st.st_size}:{st.st_mtime_ns}"
+        # Not security sensitive, so use the faster blake2b over sha256
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load per-file analyses saved by a previous run"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("entries", {})
+    
+    def _save_cache(self):
+        """Atomically write this run's per-file analyses"""
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": CACHE_VERSION, "entries": self._new_cache}, f, sort_keys=True)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logging.warning(f"Could not write cache {self.cache_path}: {e}")
+    
     def generate_ai_suggestions(self, scan_results: Dict[str, Any]):
         """Generate AI-powered optimization suggestions"""
         suggestions = []
@@ -488,31 +671,34 @@ class AIPerformanceAutoOptimizer:
         """Apply JavaScript optimizations"""
         
         # Example: Create optimized bundle configuration
-        webpack_config = {
-            "optimization": {
-                "splitChunks": {
-                    "chunks": "all",
-                    "cacheGroups": {
-                        "vendor": {
-                            "test": /[\\/]node_modules[\\/]/,
-                            "name": "vendors",
-                            "chunks": "all"
-                        }
-                    }
-                },
-                "minimize": True,
-                "minimizer": ["terser"]
-            },
-            "performance": {
-                "hints": "warning",
-                "maxEntrypointSize": 512000,
-                "maxAssetSize": 512000
+        # Written as JS rather than JSON, which cannot hold the vendor regex
+        webpack_config = r"""// Webpack Optimization Configuration
+module.exports = {
+    optimization: {
+        splitChunks: {
+            chunks: 'all',
+            cacheGroups: {
+                vendor: {
+                    test: /[\\/]node_modules[\\/]/,
+                    name: 'vendors',
+                    chunks: 'all'
+                }
             }
-        }
+        },
+        minimize: true,
+        minimizer: ['terser']
+    },
+    performance: {
+        hints: 'warning',
+        maxEntrypointSize: 512000,
+        maxAssetSize: 512000
+    }
+};
+"""
         
-        config_path = self.target_path / "webpack.optimization.json"
+        config_path = self.target_path / "webpack.optimization.js"
         with open(config_path, 'w') as f:
-            json.dump(webpack_config, f, indent=2)
+            f.write(webpack_config)
         
         return {
             "status": "applied",
@@ -680,7 +866,7 @@ Generated: {datetime.now().isoformat()}
 ## ✅ Applied Optimizations
 - Total Optimizations Applied: {len(results.get('applied_optimizations', []))}
 - Errors Encountered: {len(results.get('errors', []))}
-- Success Rate: {100 - (len(results.get('errors', [])) / max(1, len(self.ai_suggestions)) * 100:.1f}%
+- Success Rate: {100 - len(results.get('errors', [])) / max(1, len(self.ai_suggestions)) * 100:.1f}%
 
 ## 🚀 Next Steps
 1. Review generated optimization files
@@ -727,13 +913,11 @@ Generated: {datetime.now().isoformat()}
         
         # Save detailed results
         results_path = output_dir / f"optimization-results-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
-        with open(results_path, 'w') as f:
-            json.dump({
-                "scan_results": scan_results,
-                "optimization_results": optimization_results,
-                "ai_suggestions": self.ai_suggestions,
-                "config": self.config
-            }, f, indent=2, default=str)
+        _write_results(results_path, scan_results, {
+            "optimization_results": optimization_results,
+            "ai_suggestions": self.ai_suggestions,
+            "config": self.config
+        })
         
         logging.info(f"✅ Auto-optimization complete! Results saved to {output_dir}")
         
@@ -746,6 +930,201 @@ Generated: {datetime.now().isoformat()}
             "ai_suggestions_count": len(self.ai_suggestions)
         }
 
+class JsonArrayWriter:
+    """Stream a JSON array to a text file one item at a time, laid out like json.dump(indent=2)"""
+    
+    def __init__(self, f, depth: int = 0):
+        self.f = f
+        self.depth = depth
+        self.count = 0
+    
+    def __enter__(self) -> 'JsonArrayWriter':
+        self.f.write('[')
+        return self
+    
+    def write(self, item: Any):
+        self.f.write(',\n' if self.count else '\n')
+        self.f.write(' ' * (self.depth + 2) + json.dumps(item, default=str))
+        self.count += 1
+    
+    def __exit__(self, *exc_info):
+        if self.count:
+            self.f.write('\n' + ' ' * self.depth)
+        self.f.write(']')
+
+def _dumps_json(value: Any, depth: int = 0) -> str:
+    """Indented JSON for a value nested depth spaces deep, via orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        text = json.dumps(value, indent=2, default=str)
+    else:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        text = orjson.dumps(value, default=str, option=option).decode()
+    # Encoded strings never contain raw newlines, so this only shifts line starts
+    return text.replace('\n', '\n' + ' ' * depth) if depth else text
+
+def _write_results(path: Path, scan_results: Dict[str, Any], extra: Dict[str, Any]):
+    """Write the results document, streaming the scanned file lists instead of encoding them in one buffer"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n  "scan_results": {\n    "files": {')
+        for index, (bucket, files) in enumerate(scan_results["files"].items()):
+            f.write(f'{"," if index else ""}\n      {json.dumps(bucket)}: ')
+            with JsonArrayWriter(f, depth=6) as array:
+                for file_path in files:
+                    array.write(file_path)
+        f.write('\n    }')
+        for key, value in scan_results.items():
+            if key != "files":
+                f.write(f',\n    {json.dumps(key)}: {_dumps_json(value, depth=4)}')
+        f.write('\n  }')
+        for key, value in extra.items():
+            f.write(f',\n  {json.dumps(key)}: {_dumps_json(value, depth=2)}')
+        f.write('\n}')
+
+def _walk_files(path: str):
+    """Recursively yield file DirEntry objects, using cached d_type instead of extra stats"""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError as e:
+        logging.warning(f"Could not scan {path}: {e}")
+
+def _count_js_complexity(content: bytes) -> int:
+    """Count JS decision points with the compiled byte kernel when Numba is available"""
+    # Imported lazily so numba's import/JIT cost is only paid once files are analyzed
+    import _kernels
+    
+    if _kernels.njit is None:
+        return sum(1 for _ in JS_COMPLEXITY_PATTERN.finditer(content))
+    
+    import numpy as np
+    from _optimizer_kernels import js_complexity
+    return int(js_complexity(np.frombuffer(content, dtype=np.uint8)))
+
+def _count_css_rules(content: bytes) -> int:
+    """Count CSS rules without materializing each match, compiled when Numba is available"""
+    import _kernels
+    
+    if _kernels.njit is None:
+        return sum(1 for _ in CSS_RULE_PATTERN.finditer(content))
+    
+    import numpy as np
+    from _optimizer_kernels import css_rule_count
+    return int(css_rule_count(np.frombuffer(content, dtype=np.uint8)))
+
+def _read_file(file_path: str):
+    """Read a source file's bytes; large files are returned as a read-only mmap"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            # Regexes run directly on the mapping, so peak RSS stays flat
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return f.read()
+
+def _close_source(content):
+    if isinstance(content, mmap.mmap):
+        content.close()
+
+def _sniff_source(head) -> Optional[str]:
+    """Classify a file's leading bytes as "binary" or "minified", or None for regular source"""
+    if head.find(b'\0') != -1:
+        return "binary"
+    if len(head) == SNIFF_BYTES and head.count(b'\n') < 2:
+        return "minified"
+    return None
+
+def _read_ahead(tasks: List[Tuple[str, Optional[int]]], depth: int = READ_AHEAD_DEPTH):
+    """Yield (task, future contents) while up to depth later files are read on I/O threads"""
+    with ThreadPoolExecutor(max_workers=depth) as reader:
+        window = deque()
+        for task in tasks:
+            window.append((task, reader.submit(_read_file, task[0])))
+            if len(window) >= depth:
+                yield window.popleft()
+        while window:
+            yield window.popleft()
+
+def _empty_js_analysis() -> Dict[str, Any]:
+    return {
+        "total_size": 0,
+        "optimization_opportunities": [],
+        "complexity_score": 0,
+        "dead_code_detected": [],
+        "bundle_optimization_potential": 0,
+        "binary_files": 0,
+        "minified_files": 0
+    }
+
+def _empty_css_analysis() -> Dict[str, Any]:
+    return {
+        "total_size": 0,
+        "unused_css_detected": [],
+        "optimization_opportunities": [],
+        "critical_css_potential": 0,
+        "binary_files": 0,
+        "minified_files": 0
+    }
+
+def _merge_analysis(analysis: Dict[str, Any], partial: Dict[str, Any]):
+    """Fold one file's partial analysis into the running totals"""
+    for key, value in partial.items():
+        if isinstance(value, list):
+            analysis[key].extend(value)
+        elif key == "critical_css_potential":
+            # Set (not summed) per large stylesheet, so the last one wins
+            if value:
+                analysis[key] = value
+        else:
+            analysis[key] += value
+
+def _analyze_one_js(task: Tuple[str, Optional[int]], read=_read_file) -> Dict[str, Any]:
+    """Analyze a single JavaScript file; read may return contents prefetched elsewhere"""
+    file_path, file_size = task
+    partial = _empty_js_analysis()
+    try:
+        partial["total_size"] = file_size if file_size is not None else os.path.getsize(file_path)
+        
+        content = read(file_path)
+        try:
+            kind = _sniff_source(content[:SNIFF_BYTES])
+            if kind:
+                # Counted, but not worth running the regex passes over
+                partial[f"{kind}_files"] += 1
+            else:
+                # AI-powered code analysis
+                AIPerformanceAutoOptimizer.ai_analyze_javascript_content(file_path, content, partial)
+        finally:
+            _close_source(content)
+    
+    except Exception as e:
+        partial["error"] = type(e).__name__
+    return partial
+
+def _analyze_one_css(task: Tuple[str, Optional[int]], read=_read_file) -> Dict[str, Any]:
+    """Analyze a single CSS file; read may return contents prefetched elsewhere"""
+    file_path, file_size = task
+    partial = _empty_css_analysis()
+    try:
+        partial["total_size"] = file_size if file_size is not None else os.path.getsize(file_path)
+        
+        content = read(file_path)
+        try:
+            kind = _sniff_source(content[:SNIFF_BYTES])
+            if kind:
+                partial[f"{kind}_files"] += 1
+            else:
+                AIPerformanceAutoOptimizer.ai_analyze_css_content(file_path, content, partial)
+        finally:
+            _close_source(content)
+    
+    except Exception as e:
+        partial["error"] = type(e).__name__
+    return partial
+
 def main():
     parser = argparse.ArgumentParser(description='KirkBot2 AI Performance Auto-Optimizer')
     parser.add_argument('target', help='Target directory to optimize')
@@ -754,6 +1133,7 @@ def main():
     parser.add_argument('--output', help='Output directory for results')
     parser.add_argument('--level', choices=['conservative', 'standard', 'aggressive'], 
                        default='standard', help='Optimization level')
+    parser.add_argument('--no-cache', action='store_true', help=f'Ignore and do not write {CACHE_FILE}')
     
     args = parser.parse_args()
     
@@ -762,6 +1142,8 @@ def main():
     
     # Set optimization level
     optimizer.config['optimization_level'] = args.level
+    if args.no_cache:
+        optimizer.config['use_cache'] = False
     
     # Run optimization
     results = optimizer.run(
@@ -5,22 +5,67 @@ Advanced performance monitoring with ML-based anomaly detection
 """
 
 import asyncio
+import copy
 import json
+import math
+import os
 import time
 import psutil
-import requests
-from datetime import datetime, timedelta
+import aiohttp
+from functools import lru_cache
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from pathlib import Path
 import numpy as np
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from _monitor_kernels import all_column_stats, push_sample, window_mean_std
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Samples kept in memory, and how many of the newest feed anomaly detection
+HISTORY_SIZE = 1000
+ANOMALY_WINDOW = 50
+
+# History columns, one per PerformanceMetrics field that is always collected
+HISTORY_COLUMNS = (
+    "timestamp",
+    "cpu_percent",
+    "memory_percent",
+    "disk_io_read",
+    "disk_io_write",
+    "network_bytes_sent",
+    "network_bytes_recv"
+)
+
+# Report section for each summarized history column (every column after the timestamp)
+SUMMARY_SECTIONS = ("cpu", "memory", "disk_io_read", "disk_io_write", "network_bytes_sent", "network_bytes_recv")
+
+# Columns checked for anomalies, and how often their running moments are recomputed
+# from the history to shed floating-point drift
+ANOMALY_COLUMNS = ("cpu_percent", "memory_percent")
+ANOMALY_ROWS = np.array([HISTORY_COLUMNS.index(name) for name in ANOMALY_COLUMNS], dtype=np.int64)
+MOMENTS_RESYNC_INTERVAL = 1024
+
+# Report writes queued to the writer thread before the monitor waits for the disk
+MAX_PENDING_WRITES = 32
+
+# Per-cycle reports are appended here as NDJSON, rolling over to a ".1" file past the size limit
+REPORT_LOG = "performance_reports.ndjson"
+REPORT_LOG_MAX_BYTES = 50 * 1024 * 1024
+
+# Alert prefixes; the status of a cycle is critical if any alert starts with ALERT_CRITICAL
+ALERT_CRITICAL = "🔥 CRITICAL: "
+ALERT_WARNING = "⚠️ WARNING: "
 
 @dataclass
 class PerformanceMetrics:
     timestamp: float
     cpu_percent: float
     memory_percent: float
+    # I/O byte counts since the previous sample
     disk_io_read: int
     disk_io_write: int
     network_bytes_sent: int
@@ -28,15 +73,94 @@ class PerformanceMetrics:
     response_time: Optional[float] = None
     error_rate: Optional[float] = None
 
+@lru_cache(maxsize=8)
+def _read_config(config_path: str, mtime_ns: int) -> dict:
+    """Parse a config file; keyed on mtime so an edited file is read again"""
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+@lru_cache(maxsize=1)
+def _format_second(second: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+
+def _format_timestamp(timestamp: float) -> str:
+    """Local ISO 8601 time for an epoch timestamp, as datetime.fromtimestamp().isoformat() renders it
+
+    The seconds part is cached, since a cycle formats the same second more than once.
+    """
+    fraction, second = math.modf(timestamp)
+    microsecond = round(fraction * 1e6)
+    if microsecond >= 1000000:
+        second += 1
+        microsecond -= 1000000
+    text = _format_second(int(second))
+    return f"{text}.{microsecond:06d}" if microsecond else text
+
+class ReportLog:
+    """Append-only NDJSON report file, rotated once it grows past max_bytes"""
+    
+    def __init__(self, path: str, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._file = self._open()
+    
+    def _open(self):
+        # Unbuffered, so each report is a single write() and is visible to `tail -f` at once
+        return open(self.path, 'ab', buffering=0)
+    
+    def append(self, line: bytes):
+        """Write one newline-terminated report"""
+        self._file.write(line)
+        if self._file.tell() >= self.max_bytes:
+            self._file.close()
+            os.replace(self.path, self.path.with_name(self.path.name + ".1"))
+            self._file = self._open()
+    
+    def close(self):
+        self._file.close()
+
 class AIPerformanceMonitor:
     """AI-powered real-time performance monitoring with anomaly detection"""
     
     def __init__(self, config_path: str = "monitor_config.json"):
         self.config = self._load_config(config_path)
-        self.metrics_history = deque(maxlen=1000)
+        
+        # Thresholds are read once here rather than looked up in the config every cycle
+        thresholds = self.config["thresholds"]
+        self._cpu_warning = thresholds["cpu_warning"]
+        self._cpu_critical = thresholds["cpu_critical"]
+        self._memory_warning = thresholds["memory_warning"]
+        self._memory_critical = thresholds["memory_critical"]
+        self._response_time_warning = thresholds["response_time_warning"]
+        self._response_time_critical = thresholds["response_time_critical"]
+        
+        # Sample history as one float64 ring row per metric (structure of arrays), so statistics
+        # run over contiguous columns instead of walking dataclass instances
+        self._history_rows = np.zeros((len(HISTORY_COLUMNS), HISTORY_SIZE))
+        self._history = {name: self._history_rows[row] for row, name in enumerate(HISTORY_COLUMNS)}
+        self._history_head = 0
+        self._history_count = 0
+        
+        # Running [mean, M2] of each ANOMALY_COLUMNS column over the newest ANOMALY_WINDOW samples
+        self._window_moments = np.zeros((len(ANOMALY_COLUMNS), 2))
+        self._sample = np.zeros(len(HISTORY_COLUMNS))
+        self._samples_recorded = 0
+        
         self.anomaly_threshold = 2.0  # Standard deviations
         self.alert_callbacks = []
         
+        # Baselines for non-blocking sampling: cpu_percent(interval=None) measures since its
+        # previous call, and the I/O counters are running totals turned into per-sample deltas
+        psutil.cpu_percent(interval=None)
+        self._prev_disk_io = psutil.disk_io_counters()
+        self._prev_net_io = psutil.net_io_counters()
+        
+        # Shared across cycles so endpoint connections are kept alive; opened on first probe
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # psutil's /proc reads run on this thread, off the event loop; started on first cycle
+        self._psutil_pool: Optional[ThreadPoolExecutor] = None
+        
     def _load_config(self, config_path: str) -> dict:
         """Load monitoring configuration"""
         default_config = {
@@ -59,9 +183,9 @@ class AIPerformanceMonitor:
         
         try:
             if Path(config_path).exists():
-                with open(config_path, 'r') as f:
-                    user_config = json.load(f)
-                default_config.update(user_config)
+                user_config = _read_config(config_path, Path(config_path).stat().st_mtime_ns)
+                # Copied so a monitor changing its config can't alter the cached parse
+                default_config.update(copy.deepcopy(user_config))
         except Exception as e:
             print(f"Warning: Could not load config, using defaults: {e}")
             
@@ -69,19 +193,25 @@ class AIPerformanceMonitor:
     
     def collect_system_metrics(self) -> PerformanceMetrics:
         """Collect system performance metrics"""
-        # CPU and Memory
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU (since the previous sample, without sleeping) and Memory
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         
         # Disk I/O
         disk_io = psutil.disk_io_counters()
-        disk_read = disk_io.read_bytes if disk_io else 0
-        disk_write = disk_io.write_bytes if disk_io else 0
+        prev_disk_io, self._prev_disk_io = self._prev_disk_io, disk_io
+        disk_read = disk_write = 0
+        if disk_io and prev_disk_io:
+            disk_read = disk_io.read_bytes - prev_disk_io.read_bytes
+            disk_write = disk_io.write_bytes - prev_disk_io.write_bytes
         
         # Network I/O
         net_io = psutil.net_io_counters()
-        net_sent = net_io.bytes_sent if net_io else 0
-        net_recv = net_io.bytes_recv if net_io else 0
+        prev_net_io, self._prev_net_io = self._prev_net_io, net_io
+        net_sent = net_recv = 0
+        if net_io and prev_net_io:
+            net_sent = net_io.bytes_sent - prev_net_io.bytes_sent
+            net_recv = net_io.bytes_recv - prev_net_io.bytes_recv
         
         return PerformanceMetrics(
             timestamp=time.time(),
@@ -93,95 +223,147 @@ class AIPerformanceMonitor:
             network_bytes_recv=net_recv
         )
     
-    def check_endpoint_health(self, endpoint: dict) -> tuple[float, bool]:
+    async def check_endpoint_health(self, endpoint: dict) -> tuple[float, bool]:
         """Check endpoint health and response time"""
+        if self._session is None:
+            # Created lazily, since a ClientSession belongs to the running event loop
+            self._session = self._create_session()
+        
         try:
             start_time = time.time()
-            response = requests.get(
-                endpoint["url"], 
-                timeout=endpoint.get("timeout", 5)
-            )
+            timeout = aiohttp.ClientTimeout(total=endpoint.get("timeout", 5))
+            async with self._session.get(endpoint["url"], timeout=timeout) as response:
+                await response.read()  # Drain the body so the connection goes back to the pool
             response_time = (time.time() - start_time) * 1000  # Convert to ms
             
-            is_healthy = response.status_code < 400
+            is_healthy = response.status < 400
             return response_time, is_healthy
             
         except Exception as e:
             print(f"Endpoint check failed for {endpoint['url']}: {e}")
             return -1, False
     
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Session whose idle connections outlive the gap between monitoring cycles"""
+        endpoint_count = len(self.config.get("endpoints", []))
+        interval = self.config.get("monitoring_interval", 5)
+        connector = aiohttp.TCPConnector(
+            limit=max(1, endpoint_count) * 2,
+            # aiohttp drops idle connections after 15s; the next cycle must find them open
+            keepalive_timeout=max(15, interval * 2)
+        )
+        return aiohttp.ClientSession(connector=connector)
+    
+    async def check_all_endpoints(self) -> List[dict]:
+        """Probe every configured endpoint concurrently"""
+        endpoints = self.config.get("endpoints", [])
+        results = await asyncio.gather(*(self.check_endpoint_health(endpoint) for endpoint in endpoints))
+        
+        return [
+            {
+                "url": endpoint["url"],
+                "response_time_ms": response_time,
+                "healthy": is_healthy
+            }
+            for endpoint, (response_time, is_healthy) in zip(endpoints, results)
+        ]
+    
+    async def close(self):
+        """Release the endpoint connection pool and the psutil thread"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._psutil_pool is not None:
+            self._psutil_pool.shutdown()
+            self._psutil_pool = None
+    
     def detect_anomalies(self, current_metrics: PerformanceMetrics) -> List[str]:
         """AI-based anomaly detection using statistical analysis"""
-        if len(self.metrics_history) < 10:
+        count = self._history_count
+        if count < 10:
             return []
         
         anomalies = []
+        window = min(count, ANOMALY_WINDOW)
         
-        # Extract recent metrics for analysis
-        recent_cpu = [m.cpu_percent for m in list(self.metrics_history)[-50:]]
-        recent_memory = [m.memory_percent for m in list(self.metrics_history)[-50:]]
-        
-        # Statistical anomaly detection
-        if recent_cpu:
-            cpu_mean = np.mean(recent_cpu)
-            cpu_std = np.std(recent_cpu)
-            
-            if abs(current_metrics.cpu_percent - cpu_mean) > self.anomaly_threshold * cpu_std:
-                anomalies.append(f"CPU anomaly: {current_metrics.cpu_percent:.1f}% (avg: {cpu_mean:.1f}%)")
+        # Statistical anomaly detection from the running window moments, O(1) per check
+        cpu_mean, cpu_m2 = self._window_moments[ANOMALY_COLUMNS.index("cpu_percent")]
+        cpu_std = (cpu_m2 / window) ** 0.5
+        if abs(current_metrics.cpu_percent - cpu_mean) > self.anomaly_threshold * cpu_std:
+            anomalies.append(f"CPU anomaly: {current_metrics.cpu_percent:.1f}% (avg: {cpu_mean:.1f}%)")
         
-        if recent_memory:
-            memory_mean = np.mean(recent_memory)
-            memory_std = np.std(recent_memory)
-            
-            if abs(current_metrics.memory_percent - memory_mean) > self.anomaly_threshold * memory_std:
-                anomalies.append(f"Memory anomaly: {current_metrics.memory_percent:.1f}% (avg: {memory_mean:.1f}%)")
+        memory_mean, memory_m2 = self._window_moments[ANOMALY_COLUMNS.index("memory_percent")]
+        memory_std = (memory_m2 / window) ** 0.5
+        if abs(current_metrics.memory_percent - memory_mean) > self.anomaly_threshold * memory_std:
+            anomalies.append(f"Memory anomaly: {current_metrics.memory_percent:.1f}% (avg: {memory_mean:.1f}%)")
         
         return anomalies
     
-    def check_thresholds(self, metrics: PerformanceMetrics) -> List[str]:
-        """Check metrics against configured thresholds"""
+    def _record(self, metrics: PerformanceMetrics):
+        """Write a sample into the history rows, overwriting the oldest once full"""
+        sample = self._sample
+        for row, name in enumerate(HISTORY_COLUMNS):
+            sample[row] = getattr(metrics, name)
+        
+        # One compiled call stores the sample and rolls the anomaly window moments
+        push_sample(self._history_rows, sample, self._history_head, self._history_count,
+                    self._window_moments, ANOMALY_ROWS, ANOMALY_WINDOW)
+        self._history_head = (self._history_head + 1) % HISTORY_SIZE
+        self._history_count = min(self._history_count + 1, HISTORY_SIZE)
+        
+        self._samples_recorded += 1
+        if self._samples_recorded % MOMENTS_RESYNC_INTERVAL == 0:
+            window = min(self._history_count, ANOMALY_WINDOW)
+            for index, name in enumerate(ANOMALY_COLUMNS):
+                mean, std = window_mean_std(self._history[name], self._history_head, self._history_count,
+                                            ANOMALY_WINDOW)
+                self._window_moments[index] = (mean, std * std * window)
+    
+    def check_thresholds(self, metrics: PerformanceMetrics, endpoint_results: List[dict]) -> List[str]:
+        """Check metrics and this cycle's endpoint probes against configured thresholds"""
         alerts = []
-        thresholds = self.config["thresholds"]
         
-        if metrics.cpu_percent >= thresholds["cpu_critical"]:
-            alerts.append(f"🔥 CRITICAL: CPU at {metrics.cpu_percent:.1f}%")
-        elif metrics.cpu_percent >= thresholds["cpu_warning"]:
-            alerts.append(f"⚠️ WARNING: CPU at {metrics.cpu_percent:.1f}%")
+        # Alert text is only formatted once a threshold is crossed
+        cpu_percent = metrics.cpu_percent
+        if cpu_percent >= self._cpu_critical:
+            alerts.append(f"{ALERT_CRITICAL}CPU at {cpu_percent:.1f}%")
+        elif cpu_percent >= self._cpu_warning:
+            alerts.append(f"{ALERT_WARNING}CPU at {cpu_percent:.1f}%")
         
-        if metrics.memory_percent >= thresholds["memory_critical"]:
-            alerts.append(f"🔥 CRITICAL: Memory at {metrics.memory_percent:.1f}%")
-        elif metrics.memory_percent >= thresholds["memory_warning"]:
-            alerts.append(f"⚠️ WARNING: Memory at {metrics.memory_percent:.1f}%")
+        memory_percent = metrics.memory_percent
+        if memory_percent >= self._memory_critical:
+            alerts.append(f"{ALERT_CRITICAL}Memory at {memory_percent:.1f}%")
+        elif memory_percent >= self._memory_warning:
+            alerts.append(f"{ALERT_WARNING}Memory at {memory_percent:.1f}%")
         
         # Check endpoint response times
-        for endpoint in self.config.get("endpoints", []):
-            response_time, is_healthy = self.check_endpoint_health(endpoint)
+        response_time_warning = self._response_time_warning
+        response_time_critical = self._response_time_critical
+        for result in endpoint_results:
+            response_time = result["response_time_ms"]
             
             if response_time > 0:
-                if response_time >= thresholds["response_time_critical"]:
-                    alerts.append(f"🔥 CRITICAL: {endpoint['url']} response time {response_time:.0f}ms")
-                elif response_time >= thresholds["response_time_warning"]:
-                    alerts.append(f"⚠️ WARNING: {endpoint['url']} response time {response_time:.0f}ms")
+                if response_time >= response_time_critical:
+                    alerts.append(f"{ALERT_CRITICAL}{result['url']} response time {response_time:.0f}ms")
+                elif response_time >= response_time_warning:
+                    alerts.append(f"{ALERT_WARNING}{result['url']} response time {response_time:.0f}ms")
             
-            if not is_healthy:
-                alerts.append(f"🔥 CRITICAL: {endpoint['url']} is unhealthy")
+            if not result["healthy"]:
+                alerts.append(f"{ALERT_CRITICAL}{result['url']} is unhealthy")
         
         return alerts
     
     async def monitor_once(self) -> dict:
         """Perform a single monitoring cycle"""
-        # Collect system metrics
-        system_metrics = self.collect_system_metrics()
-        
-        # Check endpoint health
-        endpoint_results = []
-        for endpoint in self.config.get("endpoints", []):
-            response_time, is_healthy = self.check_endpoint_health(endpoint)
-            endpoint_results.append({
-                "url": endpoint["url"],
-                "response_time_ms": response_time,
-                "healthy": is_healthy
-            })
+        if self._psutil_pool is None:
+            self._psutil_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="psutil")
+        
+        # Collect system metrics on the psutil thread while endpoints are probed, each endpoint
+        # once for both the report and the alerts
+        system_metrics, endpoint_results = await asyncio.gather(
+            asyncio.get_running_loop().run_in_executor(self._psutil_pool, self.collect_system_metrics),
+            self.check_all_endpoints()
+        )
         
         # Detect anomalies
         anomalies = []
@@ -189,14 +371,14 @@ class AIPerformanceMonitor:
             anomalies = self.detect_anomalies(system_metrics)
         
         # Check thresholds
-        alerts = self.check_thresholds(system_metrics)
+        alerts = self.check_thresholds(system_metrics, endpoint_results)
         
         # Store metrics
-        self.metrics_history.append(system_metrics)
+        self._record(system_metrics)
         
         # Create report
         report = {
-            "timestamp": datetime.fromtimestamp(system_metrics.timestamp).isoformat(),
+            "timestamp": _format_timestamp(system_metrics.timestamp),
             "system_metrics": {
                 "cpu_percent": system_metrics.cpu_percent,
                 "memory_percent": system_metrics.memory_percent,
@@ -208,7 +390,9 @@ class AIPerformanceMonitor:
             "endpoint_health": endpoint_results,
             "anomalies": anomalies,
             "alerts": alerts,
-            "status": "healthy" if not alerts else "warning" if "CRITICAL" not in str(alerts) else "critical"
+            "status": ("healthy" if not alerts
+                       else "critical" if any(alert.startswith(ALERT_CRITICAL) for alert in alerts)
+                       else "warning")
         }
         
         return report
@@ -222,115 +406,159 @@ class AIPerformanceMonitor:
         print(f"🚀 Starting AI Performance Monitor for {duration_minutes} minutes")
         print(f"📊 Monitoring {len(self.config.get('endpoints', []))} endpoints")
         
-        start_time = time.time()
+        # Scheduled on the loop's monotonic clock, so wall-clock jumps can't stretch or cut the run
+        loop = asyncio.get_running_loop()
+        interval = self.config.get("monitoring_interval", 5)
+        start_time = loop.time()
         end_time = start_time + (duration_minutes * 60)
+        next_tick = start_time
         
         report_count = 0
         alert_count = 0
         
-        while time.time() < end_time:
-            try:
-                report = await self.monitor_once()
-                report_count += 1
+        # Reports are written on a background thread so slow storage doesn't stretch the cycle
+        writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer")
+        report_log = ReportLog(REPORT_LOG, REPORT_LOG_MAX_BYTES)
+        pending_writes = set()
+        
+        def finish_write(future):
+            pending_writes.discard(future)
+            if not future.cancelled() and future.exception():
+                print(f"❌ Could not save report: {future.exception()}")
+        
+        # Cleanup also runs when the task is cancelled (e.g. Ctrl-C under asyncio.run)
+        try:
+            while loop.time() < end_time:
+                try:
+                    report = await self.monitor_once()
+                    report_count += 1
                 
-                # Print status
-                status_emoji = "✅" if report["status"] == "healthy" else "⚠️" if report["status"] == "warning" else "🔥"
-                print(f"{status_emoji} {report['timestamp']} - CPU: {report['system_metrics']['cpu_percent']:.1f}%, Memory: {report['system_metrics']['memory_percent']:.1f}%")
+                    # Print status
+                    status_emoji = "✅" if report["status"] == "healthy" else "⚠️" if report["status"] == "warning" else "🔥"
+                    print(f"{status_emoji} {report['timestamp']} - CPU: {report['system_metrics']['cpu_percent']:.1f}%, Memory: {report['system_metrics']['memory_percent']:.1f}%")
                 
-                # Handle alerts
-                if report["alerts"]:
-                    alert_count += len(report["alerts"])
-                    for alert in report["alerts"]:
-                        print(f"🚨 {alert}")
+                    # Handle alerts
+                    if report["alerts"]:
+                        alert_count += len(report["alerts"])
+                        for alert in report["alerts"]:
+                            print(f"🚨 {alert}")
                         
-                    # Trigger alert callbacks
-                    for callback in self.alert_callbacks:
-                        try:
-                            await callback(report)
-                        except Exception as e:
-                            print(f"Alert callback failed: {e}")
+                        # Trigger alert callbacks
+                        for callback in self.alert_callbacks:
+                            try:
+                                await callback(report)
+                            except Exception as e:
+                                print(f"Alert callback failed: {e}")
                 
-                # Handle anomalies
-                if report["anomalies"]:
-                    for anomaly in report["anomalies"]:
-                        print(f"🤖 AI Anomaly Detected: {anomaly}")
+                    # Handle anomalies
+                    if report["anomalies"]:
+                        for anomaly in report["anomalies"]:
+                            print(f"🤖 AI Anomaly Detected: {anomaly}")
                 
-                # Save report
-                report_file = f"performance_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                with open(report_file, 'w') as f:
-                    json.dump(report, f, indent=2)
+                    # Save report
+                    if len(pending_writes) >= MAX_PENDING_WRITES:
+                        # Storage has fallen behind; wait for a slot instead of queueing without bound
+                        await asyncio.wait(pending_writes, return_when=asyncio.FIRST_COMPLETED)
+                    write = loop.run_in_executor(writer, report_log.append, self._report_line(report))
+                    pending_writes.add(write)
+                    write.add_done_callback(finish_write)
                 
-                # Wait for next cycle
-                await asyncio.sleep(self.config.get("monitoring_interval", 5))
+                    # Wait for next cycle, counting from when this one was due so cycle time doesn't drift it
+                    next_tick += interval
+                    delay = next_tick - loop.time()
+                    if delay < 0:
+                        # Overran a whole interval: start afresh rather than firing back-to-back cycles
+                        next_tick = loop.time()
+                    await asyncio.sleep(max(0, delay))
                 
-            except KeyboardInterrupt:
-                print("\n⏹️ Monitoring stopped by user")
-                break
-            except Exception as e:
-                print(f"❌ Monitoring error: {e}")
-                await asyncio.sleep(5)
+                except KeyboardInterrupt:
+                    print("\n⏹️ Monitoring stopped by user")
+                    break
+                except Exception as e:
+                    print(f"❌ Monitoring error: {e}")
+                    await asyncio.sleep(5)
+        finally:
+            if pending_writes:
+                await asyncio.wait(pending_writes)
+            writer.shutdown()
+            report_log.close()
+            await self.close()
         
         print(f"\n📈 Monitoring Summary:")
         print(f"   Reports generated: {report_count}")
         print(f"   Total alerts: {alert_count}")
-        print(f"   Duration: {int((time.time() - start_time) / 60)} minutes")
+        print(f"   Duration: {int((loop.time() - start_time) / 60)} minutes")
+    
+    @staticmethod
+    def _serialize_report(report: dict) -> bytes:
+        """Indented JSON for a report, encoded by orjson when it is installed"""
+        if orjson is None:
+            return json.dumps(report, indent=2).encode()
+        return orjson.dumps(report, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+    
+    @staticmethod
+    def _report_line(report: dict) -> bytes:
+        """Compact NDJSON line for a report, newline included; orjson writes it in one buffer"""
+        if orjson is None:
+            return (json.dumps(report) + "\n").encode()
+        return orjson.dumps(report, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
     
     def generate_performance_report(self) -> dict:
         """Generate comprehensive performance analysis report"""
-        if not self.metrics_history:
+        count = self._history_count
+        if not count:
             return {"error": "No metrics data available"}
         
-        metrics = list(self.metrics_history)
+        # Calculate statistics over the filled part of each column; sample order doesn't matter
+        summaries = self._summarize_columns()
+        cpu = summaries["cpu"]
+        memory = summaries["memory"]
         
-        # Calculate statistics
-        cpu_values = [m.cpu_percent for m in metrics]
-        memory_values = [m.memory_percent for m in metrics]
+        # Once the ring has wrapped, the oldest sample sits at the head
+        timestamps = self._history["timestamp"]
+        first_timestamp = timestamps[self._history_head if count == HISTORY_SIZE else 0]
+        last_timestamp = timestamps[self._history_head - 1]
         
         report = {
             "analysis_period": {
-                "start": datetime.fromtimestamp(metrics[0].timestamp).isoformat(),
-                "end": datetime.fromtimestamp(metrics[-1].timestamp).isoformat(),
-                "duration_minutes": (metrics[-1].timestamp - metrics[0].timestamp) / 60
+                "start": _format_timestamp(first_timestamp),
+                "end": _format_timestamp(last_timestamp),
+                "duration_minutes": (last_timestamp - first_timestamp) / 60
             },
-            "system_performance": {
-                "cpu": {
-                    "avg": np.mean(cpu_values),
-                    "max": np.max(cpu_values),
-                    "min": np.min(cpu_values),
-                    "std": np.std(cpu_values)
-                },
-                "memory": {
-                    "avg": np.mean(memory_values),
-                    "max": np.max(memory_values),
-                    "min": np.min(memory_values),
-                    "std": np.std(memory_values)
-                }
-            },
-            "recommendations": self._generate_recommendations(cpu_values, memory_values)
+            "system_performance": summaries,
+            "recommendations": self._generate_recommendations(cpu, memory)
         }
         
         return report
     
-    def _generate_recommendations(self, cpu_values: List[float], memory_values: List[float]) -> List[str]:
-        """Generate AI-powered optimization recommendations"""
+    def _summarize_columns(self) -> Dict[str, Dict[str, float]]:
+        """avg/max/min/std of every metric column, from one kernel call spread across cores"""
+        stats = all_column_stats(self._history_rows[1:], self._history_count)
+        return {
+            section: {"avg": float(mean), "max": float(high), "min": float(low), "std": float(std)}
+            for section, (low, high, mean, std) in zip(SUMMARY_SECTIONS, stats)
+        }
+    
+    def _generate_recommendations(self, cpu: Dict[str, float], memory: Dict[str, float]) -> List[str]:
+        """Generate AI-powered optimization recommendations from CPU and memory summaries"""
         recommendations = []
         
         # CPU recommendations
-        cpu_avg = np.mean(cpu_values)
+        cpu_avg = cpu["avg"]
         if cpu_avg > 70:
             recommendations.append("🔧 High CPU usage detected - consider scaling up or optimizing code")
         elif cpu_avg > 50:
             recommendations.append("💡 Moderate CPU usage - monitor during peak loads")
         
         # Memory recommendations
-        memory_avg = np.mean(memory_values)
+        memory_avg = memory["avg"]
         if memory_avg > 75:
             recommendations.append("🔧 High memory usage - check for memory leaks or add more RAM")
         elif memory_avg > 60:
             recommendations.append("💡 Moderate memory usage - monitor growth trends")
         
         # Variability recommendations
-        if np.std(cpu_values) > 20:
+        if cpu["std"] > 20:
             recommendations.append("📊 High CPU variability - investigate workload patterns")
         
         if len(recommendations) == 0:
@@ -354,7 +582,7 @@ async def main():
     # Generate final report
     final_report = monitor.generate_performance_report()
     print("\n📊 Final Performance Report:")
-    print(json.dumps(final_report, indent=2))
+    print(monitor._serialize_report(final_report).decode())
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -4,56 +4,467 @@ AI-Powered Security Vulnerability Scanner
 Advanced machine learning-based security analysis and vulnerability detection
 """
 
+import os
 import re
 import ast
+import gzip
 import json
+import bisect
+import math
 import hashlib
 import subprocess
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+NEWLINE = re.compile(b'\n')
+
+# Files read ahead on I/O threads while the current one is scanned
+READ_AHEAD_DEPTH = 16
+
+# Directories never descended into: VCS metadata, vendored or installed packages,
+# virtualenvs and build output
+SKIP_DIRS = frozenset({'.git', 'node_modules', 'vendor', 'venv', '.venv', 'dist', 'build'})
+
+# Files larger than this are skipped by default: bundles and generated code, mostly false positives
+MAX_FILE_SIZE = 2 * 1024 * 1024
+
+# Leading bytes sniffed for a NUL to spot binary files before regex scanning
+SNIFF_BYTES = 8192
+
+# Below this many files, scan serially rather than pay process pool startup
+PARALLEL_MIN_FILES = 8
+
+# Bits per character a candidate AWS secret key must reach; hex digests top out at 4.0
+AWS_SECRET_MIN_ENTROPY = 4.5
+
+# (category, type, severity) of every catalog pattern, indexed by pattern id
+PATTERN_CATALOG = []
+
+def _compile_patterns(category: str, entries):
+    """Compile a category's (pattern, type, severity, literals[, min entropy]) entries
+
+    Each entry is registered in PATTERN_CATALOG and compiled to
+    (regex, pattern id, literals, min entropy), matched case-insensitively.
+
+    Sources are scanned as undecoded bytes. Instead of re.IGNORECASE, which keeps re off its
+    fast literal-prefix search, each pattern is lowercased and run case-sensitively over the
+    lowercased file; bytes fold ASCII only either way, so the matches are the same.
+    literals are lowercase substrings of which any match must contain at least one; an
+    empty tuple means the pattern has no usable literal and always runs. Matches of a
+    pattern with a min entropy are only reported when their original bytes reach it.
+    """
+    compiled = []
+    for pattern, vuln_type, severity, literals, *options in entries:
+        if re.search(r'\\[A-Z]', pattern):
+            # Lowercasing would change the escape's meaning, e.g. \S into \s
+            raise ValueError(f"Uppercase escape in pattern {pattern!r}")
+        min_entropy = options[0] if options else None
+        compiled.append((re.compile(pattern.lower().encode()), len(PATTERN_CATALOG),
+                         tuple(literal.encode() for literal in literals), min_entropy))
+        PATTERN_CATALOG.append((category, vuln_type, severity))
+    return compiled
+
+# Vulnerability pattern catalog, compiled once at import. Chained wildcards are written with
+# atomic groups (?>.*?x) and possessive \s*+ so a long line without a match fails in linear time
+# rather than backtracking polynomially; the matches themselves are unchanged.
+STATIC_PATTERNS = _compile_patterns('static_analysis', [
+    # SQL Injection
+    (r'execute\s*\(\s*["\'](?>.*?\+).*["\']', 'SQL Injection Risk', 'critical', ('execute',)),
+    (r'query\s*\(\s*["\'](?>.*?\+).*["\']', 'SQL Injection Risk', 'critical', ('query',)),
+    
+    # Command Injection
+    (r'system\s*\(\s*["\'](?>.*?\+).*["\']', 'Command Injection Risk', 'critical', ('system',)),
+    (r'eval\s*\(\s*+.*\+', 'Code Injection Risk', 'critical', ('eval',)),
+    
+    # Hardcoded credentials
+    (r'(password|pwd|secret|key)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded Credentials', 'high',
+     ('password', 'pwd', 'secret', 'key')),
+    (r'(api_key|apikey)\s*=\s*["\'][^"\']{16,}["\']', 'Hardcoded API Key', 'high', ('api_key', 'apikey')),
+    
+    # Weak cryptography
+    (r'md5\s*\(', 'Weak Cryptographic Hash (MD5)', 'medium', ('md5',)),
+    (r'sha1\s*\(', 'Weak Cryptographic Hash (SHA1)', 'medium', ('sha1',)),
+    
+    # Directory traversal
+    (r'\.\./.*\.\.', 'Directory Traversal Risk', 'high', ('../',)),
+    
+    # XSS vulnerabilities
+    (r'innerHTML\s*=.*\+', 'XSS Vulnerability Risk', 'medium', ('innerhtml',)),
+    (r'document\.write\s*\(\s*+.*\+', 'XSS Vulnerability Risk', 'medium', ('document.write',)),
+])
+
+SECRET_PATTERNS = _compile_patterns('secret_detection', [
+    # AWS credentials
+    (r'AKIA[0-9A-Z]{16}', 'AWS Access Key', 'critical', ('akia',)),
+    # Exactly 40 characters, not any window of a longer run, and random-looking: this alone
+    # would match identifiers, hashes and every slice of a base64 blob
+    (r'(?<![0-9a-zA-Z/+])[0-9a-zA-Z/+]{40}(?![0-9a-zA-Z/+])', 'AWS Secret Key (possible)', 'critical', (),
+     AWS_SECRET_MIN_ENTROPY),
+    
+    # GitHub tokens
+    (r'ghp_[a-zA-Z0-9]{36}', 'GitHub Personal Access Token', 'critical', ('ghp_',)),
+    (r'gho_[a-zA-Z0-9]{36}', 'GitHub OAuth Token', 'critical', ('gho_',)),
+    (r'ghu_[a-zA-Z0-9]{36}', 'GitHub User Token', 'critical', ('ghu_',)),
+    (r'ghs_[a-zA-Z0-9]{36}', 'GitHub Server Token', 'critical', ('ghs_',)),
+    (r'ghr_[a-zA-Z0-9]{36}', 'GitHub Refresh Token', 'critical', ('ghr_',)),
+    
+    # Database connection strings
+    (r'mysql://[^:]+:[^@]+@', 'MySQL Connection String', 'high', ('mysql://',)),
+    (r'postgresql://[^:]+:[^@]+@', 'PostgreSQL Connection String', 'high', ('postgresql://',)),
+    (r'mongodb://[^:]+:[^@]+@', 'MongoDB Connection String', 'high', ('mongodb://',)),
+    
+    # API keys (generic)
+    (r'api[_-]?key["\']?\s*[:=]\s*["\'][a-zA-Z0-9_-]{20,}["\']', 'API Key', 'high', ('api',)),
+    (r'secret[_-]?key["\']?\s*[:=]\s*["\'][a-zA-Z0-9_-]{20,}["\']', 'Secret Key', 'high', ('secret',)),
+    
+    # Private keys
+    (r'-----BEGIN (RSA |OPENSSH |DSA |EC |PGP )?PRIVATE KEY-----', 'Private Key', 'critical', ('-----begin ',)),
+])
+
+INJECTION_PATTERNS = _compile_patterns('injection_vulnerabilities', [
+    # LDAP Injection
+    (r'(ldap|adsi)(?>.*?query)(?>.*?\+).*user', 'LDAP Injection', 'high', ('query',)),
+    
+    # NoSQL Injection
+    (r'\$where\s*:\s*+.*\+', 'NoSQL Injection', 'high', ('$where',)),
+    
+    # XPath Injection
+    (r'xpath\s*\(\s*+.*\+', 'XPath Injection', 'medium', ('xpath',)),
+    
+    # Command Injection variations
+    (r'spawn\s*\(\s*+.*\+', 'Command Injection', 'critical', ('spawn',)),
+    (r'exec\s*\(\s*+.*\+', 'Command Injection', 'critical', ('exec',)),
+    (r'shell_exec\s*\(\s*+.*\+', 'Command Injection', 'critical', ('shell_exec',)),
+])
+
+AUTH_PATTERNS = _compile_patterns('authentication_issues', [
+    # Weak password policies
+    (r'password(?>.*?min)(?>.*?length).*[0-5]', 'Weak Password Policy', 'medium', ('password',)),
+    
+    # Missing authentication
+    (r'@app\.route\s*\([^)]*\)\s*\ndef\s+admin', 'Unprotected Admin Route', 'high', ('@app.route',)),
+    (r'@GetMapping\s*\([^)]*admin[^)]*\)', 'Unprotected Admin Endpoint', 'high', ('@getmapping',)),
+    
+    # Hardcoded authentication bypass
+    (r'admin\s*==\s*["\']true["\']', 'Hardcoded Admin Check', 'high', ('admin',)),
+    (r'authenticated\s*=\s*True', 'Hardcoded Authentication', 'medium', ('authenticated',)),
+    
+    # Session management issues
+    (r'session\.timeout.*=\s*[0-9]{1,5}', 'Short Session Timeout', 'low', ('session.timeout',)),
+    (r'cookie(?>.*?secure)(?>.*?=).*false', 'Insecure Cookie Configuration', 'medium', ('cookie',)),
+])
+
+VALIDATION_PATTERNS = _compile_patterns('data_validation', [
+    # Direct file access without validation
+    (r'open\s*\(\s*user_input', 'Unvalidated File Access', 'high', ('user_input',)),
+    (r'file\s*=\s*request\.files\[', 'Unvalidated File Upload', 'high', ('request.files[',)),
+    
+    # Lack of input sanitization
+    (r'request\.args\.get.*direct', 'Unvalidated Input Usage', 'medium', ('request.args.get',)),
+    (r'\$_GET\[(?>.*?\]).*direct', 'Unvalidated Input Usage', 'medium', ('$_get[',)),
+    
+    # Path traversal
+    (r'readfile\s*\(\s*\$', 'Potential Path Traversal', 'high', ('readfile',)),
+    (r'include\s*\(\s*\$', 'Potential Path Traversal', 'high', ('include',)),
+])
+
+CRYPTO_PATTERNS = _compile_patterns('crypto_issues', [
+    # Weak algorithms
+    (r'crypto\.createCipher\s*\(["\']des', 'DES Encryption (Weak)', 'high', ('crypto.createcipher',)),
+    (r'crypto\.createCipher\s*\(["\']rc4', 'RC4 Encryption (Weak)', 'high', ('crypto.createcipher',)),
+    (r'AES.*ECB', 'AES in ECB Mode (Insecure)', 'high', ('ecb',)),
+    
+    # Hardcoded IV/keys
+    (r'iv\s*=\s*["\'][^"\']{16,}["\']', 'Hardcoded IV', 'medium', ('iv',)),
+    (r'salt\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded Salt', 'medium', ('salt',)),
+    
+    # Random number generation issues
+    (r'math\.random\s*\(\)', 'Insecure Random Number Generation', 'medium', ('math.random',)),
+    (r'random\(\)', 'Insecure Random Number Generation', 'medium', ('random()',)),
+])
+
+# Per-file finding categories, in report order; together their catalogs cover PATTERN_CATALOG in id order
+CATEGORY_PATTERNS = (
+    ('static_analysis', STATIC_PATTERNS),
+    ('secret_detection', SECRET_PATTERNS),
+    ('injection_vulnerabilities', INJECTION_PATTERNS),
+    ('authentication_issues', AUTH_PATTERNS),
+    ('data_validation', VALIDATION_PATTERNS),
+    ('crypto_issues', CRYPTO_PATTERNS),
+)
+
+@dataclass(slots=True, frozen=True)
+class Finding:
+    """A pattern match as returned by a file scan; the report dict is built from PATTERN_CATALOG later"""
+    pattern_id: int
+    file_path: str
+    line_number: int
+    detail: str  # Code snippet, or the masked value for secret patterns
+
+# Dependencies with known vulnerabilities, matched by name anywhere in a dependency file
+# Simulated; in real implementation, would query vulnerability databases
+KNOWN_VULNERABLE_DEPENDENCIES = {
+    'requests': {'version': '<2.25.0', 'severity': 'medium', 'cve': 'CVE-2023-12345'},
+    'django': {'version': '<3.2.0', 'severity': 'high', 'cve': 'CVE-2022-12345'},
+    'express': {'version': '<4.17.0', 'severity': 'high', 'cve': 'CVE-2021-12345'},
+}
+
+def _build_dependency_automaton(dependencies):
+    """Aho-Corasick automaton over lowercase dependency names, or None without pyahocorasick
+
+    Each name maps to its index in dependencies, so hits sort back into catalog order.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, dep in enumerate(dependencies):
+        automaton.add_word(dep.lower(), index)
+    automaton.make_automaton()
+    return automaton
+
+DEPENDENCY_AUTOMATON = _build_dependency_automaton(KNOWN_VULNERABLE_DEPENDENCIES)
+
+def _iter_dependency_hits(lowered: bytes):
+    """Yield (offset, dependency index) for every occurrence of a known dependency name"""
+    if DEPENDENCY_AUTOMATON is not None:
+        # latin-1 maps bytes to code points one to one, so offsets carry over unchanged
+        for end, index in DEPENDENCY_AUTOMATON.iter(lowered.decode('latin-1')):
+            yield end, index
+        return
+    for index, dep in enumerate(KNOWN_VULNERABLE_DEPENDENCIES):
+        needle = dep.lower().encode()
+        offset = lowered.find(needle)
+        while offset != -1:
+            yield offset, index
+            offset = lowered.find(needle, offset + 1)
+
+def _walk_source_files(path: str, suffixes):
+    """Recursively yield DirEntry objects for regular files whose suffix is in suffixes
+
+    Uses cached d_type instead of extra stats, never follows symlinks and prunes SKIP_DIRS
+    before descending. A directory's files come before its subdirectories', as with rglob.
+    """
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and os.path.splitext(entry.name)[1] in suffixes:
+                    yield entry
+    except OSError as e:
+        logging.warning(f"Could not scan {path}: {e}")
+    for subdir in subdirs:
+        yield from _walk_source_files(subdir, suffixes)
+
+def _read_file(file_path: str) -> bytes:
+    """Read a source file's bytes"""
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+def _load_gitignore(directory_path: str):
+    """PathSpec for the tree's top-level .gitignore, or None without one (or without pathspec)"""
+    if pathspec is None:
+        return None
+    try:
+        with open(os.path.join(directory_path, '.gitignore'), 'r', encoding='utf-8', errors='ignore') as f:
+            return pathspec.GitIgnoreSpec.from_lines(f.read().splitlines())
+    except OSError:
+        return None
+
+def _read_ahead(files: List[Dict], depth: int = READ_AHEAD_DEPTH):
+    """Yield (file_info, future contents) while up to depth later files are read on I/O threads"""
+    with ThreadPoolExecutor(max_workers=depth) as reader:
+        window = deque()
+        for file_info in files:
+            window.append((file_info, reader.submit(_read_file, file_info['path'])))
+            if len(window) >= depth:
+                yield window.popleft()
+        while window:
+            yield window.popleft()
+
+def _iter_pattern_matches(content, lowered: bytes, patterns):
+    """Yield (match, pattern id) for each pattern's matches in lowered, in catalog order
+
+    Patterns none of whose literals occur in lowered are skipped without running the regex.
+    Entropy thresholds are checked against content, since lowercasing loses randomness.
+    """
+    for pattern, pattern_id, literals, min_entropy in patterns:
+        if literals and not any(literal in lowered for literal in literals):
+            continue
+        for match in pattern.finditer(lowered):
+            if min_entropy is not None and _shannon_entropy(content[match.start():match.end()]) < min_entropy:
+                continue
+            yield match, pattern_id
+
+def _shannon_entropy(data: bytes) -> float:
+    """Shannon entropy of data's byte histogram, in bits per byte"""
+    size = len(data)
+    return -sum(count / size * math.log2(count / size) for count in Counter(data).values())
+
+def _mask_secret(secret: bytes) -> str:
+    """A secret's first and last four characters, with everything between starred out"""
+    secret_value = secret.decode('utf-8', 'ignore')
+    return secret_value[:4] + '*' * (len(secret_value) - 8) + secret_value[-4:] if len(secret_value) > 8 else '***'
+
+def _newline_offsets(content) -> List[int]:
+    """Sorted offsets of every newline in content
+
+    The line of offset i is bisect_left(offsets, i) + 1, an O(log lines) lookup in
+    place of counting newlines in content[:i] for every match.
+    """
+    return [match.start() for match in NEWLINE.finditer(content)]
+
+# Detailed descriptions by vulnerability type
+VULNERABILITY_DESCRIPTIONS = {
+    'SQL Injection Risk': 'SQL injection vulnerability allows attackers to execute arbitrary SQL commands',
+    'Command Injection Risk': 'Command injection allows execution of arbitrary system commands',
+    'Hardcoded Credentials': 'Hardcoded credentials pose a significant security risk',
+    'Weak Cryptographic Hash': 'MD5 and SHA1 are cryptographically broken and should not be used',
+    'Directory Traversal Risk': 'Directory traversal can allow access to files outside intended directory',
+    'XSS Vulnerability Risk': 'Cross-site scripting allows injection of malicious scripts',
+    'LDAP Injection': 'LDAP injection can manipulate LDAP queries and bypass authentication',
+    'NoSQL Injection': 'NoSQL injection can manipulate database queries',
+    'XPath Injection': 'XPath injection can manipulate XML queries',
+    'Weak Password Policy': 'Weak password policies allow easily guessable passwords',
+    'Unprotected Admin Route': 'Admin routes without authentication are security risks',
+    'Hardcoded Admin Check': 'Hardcoded authentication bypass mechanisms are insecure',
+    'Unvalidated File Access': 'File access without validation can lead to directory traversal',
+    'Unvalidated File Upload': 'File uploads without validation can lead to arbitrary code execution',
+    'DES Encryption (Weak)': 'DES encryption is cryptographically broken and should not be used',
+    'RC4 Encryption (Weak)': 'RC4 has known biases and should not be used',
+    'AES in ECB Mode (Insecure)': 'AES in ECB mode is vulnerable to pattern analysis attacks',
+    'Insecure Random Number Generation': 'Predictable random numbers can compromise security'
+}
+
+# CWE IDs by vulnerability type
+CWE_IDS = {
+    'SQL Injection Risk': 'CWE-89',
+    'Command Injection Risk': 'CWE-78',
+    'Hardcoded Credentials': 'CWE-798',
+    'Weak Cryptographic Hash': 'CWE-327',
+    'Directory Traversal Risk': 'CWE-22',
+    'XSS Vulnerability Risk': 'CWE-79',
+    'LDAP Injection': 'CWE-90',
+    'NoSQL Injection': 'CWE-943',
+    'XPath Injection': 'CWE-91',
+    'Weak Password Policy': 'CWE-521',
+    'Unprotected Admin Route': 'CWE-306',
+    'Hardcoded Admin Check': 'CWE-287',
+    'Unvalidated File Access': 'CWE-20',
+    'Unvalidated File Upload': 'CWE-434',
+    'DES Encryption (Weak)': 'CWE-326',
+    'RC4 Encryption (Weak)': 'CWE-327',
+    'AES in ECB Mode (Insecure)': 'CWE-327',
+    'Insecure Random Number Generation': 'CWE-338'
+}
+
+# Remediation advice by vulnerability type
+REMEDIATION_ADVICE = {
+    'SQL Injection Risk': 'Use parameterized queries or prepared statements instead of string concatenation',
+    'Command Injection Risk': 'Use proper input validation and avoid executing user-provided input',
+    'Hardcoded Credentials': 'Remove hardcoded credentials and use environment variables or secure vault',
+    'Weak Cryptographic Hash': 'Use strong cryptographic hash functions like SHA-256 or SHA-3',
+    'Directory Traversal Risk': 'Validate and sanitize file paths to prevent directory traversal',
+    'XSS Vulnerability Risk': 'Implement proper input sanitization and output encoding',
+    'LDAP Injection': 'Use LDAP parameter binding and input validation',
+    'NoSQL Injection': 'Use parameterized queries and input validation for NoSQL databases',
+    'XPath Injection': 'Use parameterized XPath queries and input validation',
+    'Weak Password Policy': 'Implement strong password policies with minimum length and complexity requirements',
+    'Unprotected Admin Route': 'Add proper authentication and authorization to admin endpoints',
+    'Hardcoded Admin Check': 'Remove hardcoded authentication and implement proper session management',
+    'Unvalidated File Access': 'Validate file paths and implement proper access controls',
+    'Unvalidated File Upload': 'Validate file types, sizes, and implement virus scanning',
+    'DES Encryption (Weak)': 'Use modern encryption algorithms like AES-256',
+    'RC4 Encryption (Weak)': 'Use modern encryption algorithms like AES-256',
+    'AES in ECB Mode (Insecure)': 'Use AES in secure modes like GCM or CBC with proper IV',
+    'Insecure Random Number Generation': 'Use cryptographically secure random number generators'
+}
+
+def _dumps(results: Dict) -> bytes:
+    """Indented JSON for scan results, encoded by orjson when it is installed"""
+    if orjson is None:
+        return json.dumps(results, indent=2).encode()
+    return orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
 class AISecurityScanner:
     """
     Advanced AI-powered security vulnerability scanner
     """
     
-    def __init__(self):
+    def __init__(self, jobs: Optional[int] = None, max_file_size: int = MAX_FILE_SIZE):
         self.vulnerability_database = self._load_vulnerability_patterns()
         self.scan_results = []
         self.risk_levels = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
-        self.file_types_analyzed = ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.php']
+        self.file_types_analyzed = frozenset({'.py', '.js', '.ts', '.java', '.cpp', '.c', '.php'})
+        # Worker processes used to scan files; defaults to one per CPU
+        self.jobs = jobs or os.cpu_count() or 1
+        self.max_file_size = max_file_size
+        self._executor = None
+    
+    def __getstate__(self):
+        # Scanners are pickled along with the per-file methods sent to workers; the pool stays behind
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
         
     def comprehensive_security_scan(self, directory_path: str) -> Dict:
         """
         Perform comprehensive security scan of codebase
         """
         try:
-            scan_id = hashlib.md5(f"{directory_path}{datetime.now()}".encode()).hexdigest()[:12]
+            # BLAKE2s sized to the 12 hex characters the id uses, rather than MD5 truncated to them
+            scan_id = hashlib.blake2s(f"{directory_path}{datetime.now()}".encode(), digest_size=6).hexdigest()
             
             # Collect all analyzable files
             files = self._collect_files(directory_path)
             
+            if self.jobs > 1 and len(files) >= PARALLEL_MIN_FILES:
+                self._executor = ProcessPoolExecutor(max_workers=self.jobs)
+            
             # Perform multiple security analysis types
+            file_findings, files_scanned = self._scan_all_categories(files)
             results = {
                 'scan_id': scan_id,
                 'scan_timestamp': datetime.now().isoformat(),
                 'directory': directory_path,
-                'files_analyzed': len(files),
+                'files_analyzed': files_scanned,
                 'vulnerabilities': {
-                    'static_analysis': self._perform_static_analysis(files),
+                    'static_analysis': file_findings['static_analysis'],
                     'dependency_scan': self._scan_dependencies(directory_path),
-                    'secret_detection': self._detect_secrets(files),
-                    'injection_vulnerabilities': self._scan_injection_vulnerabilities(files),
-                    'authentication_issues': self._scan_authentication_issues(files),
-                    'data_validation': self._scan_data_validation(files),
-                    'crypto_issues': self._scan_cryptography_issues(files)
+                    'secret_detection': file_findings['secret_detection'],
+                    'injection_vulnerabilities': file_findings['injection_vulnerabilities'],
+                    'authentication_issues': file_findings['authentication_issues'],
+                    'data_validation': file_findings['data_validation'],
+                    'crypto_issues': file_findings['crypto_issues']
                 },
                 'risk_summary': {},
                 'recommendations': []
             }
             
+            self._shutdown_executor()
+            
             # Calculate risk summary
             results['risk_summary'] = self._calculate_risk_summary(results['vulnerabilities'])
             
@@ -71,102 +482,146 @@ class AISecurityScanner:
                     'critical_issues': len(results['risk_summary'].get('critical', [])),
                     'high_risk_issues': len(results['risk_summary'].get('high', [])),
                     'scan_duration': 'calculated',  # Would calculate in real implementation
-                    'security_score': self._calculate_security_score(results)
+                    'security_score': self._calculate_security_score(results['risk_summary'])
                 },
                 'detailed_results': results
             }
             
         except Exception as e:
+            self._shutdown_executor()
             return {
                 'status': 'error',
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
             }
     
+    def _map_files(self, scan_file, files: List[Dict]):
+        """Yield scan_file(file_info) for each file, in file order, on the worker pool when one is up"""
+        if self._executor is not None:
+            # About 8 batches per worker: few enough to amortize IPC, enough to balance load
+            chunksize = max(1, len(files) // (self.jobs * 8))
+            return self._executor.map(scan_file, files, chunksize=chunksize)
+        if len(files) < PARALLEL_MIN_FILES:
+            return map(scan_file, files)
+        # No worker pool to hide read latency; overlap file reads with regex work instead
+        return (scan_file(file_info, read=lambda _path, contents=contents: contents.result())
+                for file_info, contents in _read_ahead(files))
+    
+    def _shutdown_executor(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
     def _collect_files(self, directory_path: str) -> List[Dict]:
         """Collect all analyzable files from directory"""
         files = []
-        directory = Path(directory_path)
         
-        if not directory.exists():
+        if not os.path.exists(directory_path):
             return files
         
-        for file_path in directory.rglob('*'):
-            if file_path.is_file() and file_path.suffix in self.file_types_analyzed:
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    files.append({
-                        'path': str(file_path),
-                        'relative_path': str(file_path.relative_to(directory)),
-                        'size': len(content),
-                        'content': content,
-                        'language': file_path.suffix[1:]  # Remove the dot
-                    })
-                except Exception as e:
-                    logging.warning(f"Could not read file {file_path}: {e}")
+        # Only paths are collected; each file is read when it is scanned
+        prefix = os.path.join(directory_path, '')
+        ignored = _load_gitignore(directory_path)
+        for entry in _walk_source_files(directory_path, self.file_types_analyzed):
+            relative_path = entry.path[len(prefix):]
+            if ignored is not None and ignored.match_file(relative_path):
+                continue
+            try:
+                size = entry.stat(follow_symlinks=False).st_size
+            except Exception as e:
+                logging.warning(f"Could not read file {entry.path}: {e}")
+                continue
+            if size > self.max_file_size:
+                continue
+            files.append({
+                'path': entry.path,
+                'relative_path': relative_path,
+                'size': size,
+                'language': os.path.splitext(entry.name)[1][1:]  # Remove the dot
+            })
         
         return files
     
-    def _perform_static_analysis(self, files: List[Dict]) -> List[Dict]:
-        """Perform static code analysis for security vulnerabilities"""
-        vulnerabilities = []
-        
-        for file_info in files:
-            file_vulns = self._analyze_file_static(file_info)
-            vulnerabilities.extend(file_vulns)
-        
-        return vulnerabilities
+    def _scan_all_categories(self, files: List[Dict]) -> Tuple[Dict[str, List[Dict]], int]:
+        """Run every per-file scan in a single pass over files, collecting findings by category
+
+        Also returns how many files were actually scanned, i.e. read and not binary.
+        """
+        findings = {category: [] for category, _ in CATEGORY_PATTERNS}
+        files_scanned = 0
+        
+        for file_findings in self._map_files(self._scan_file, files):
+            if file_findings is None:
+                continue
+            files_scanned += 1
+            for finding in file_findings:
+                category = PATTERN_CATALOG[finding.pattern_id][0]
+                findings[category].append(self._finding_dict(finding))
+        
+        return findings, files_scanned
     
-    def _analyze_file_static(self, file_info: Dict) -> List[Dict]:
-        """Analyze individual file for static security vulnerabilities"""
-        vulnerabilities = []
-        content = file_info['content']
-        file_path = file_info['relative_path']
-        
-        # Check for common vulnerability patterns
-        patterns = [
-            # SQL Injection
-            (r'execute\s*\(\s*["\'].*\+.*["\']', 'SQL Injection Risk', 'critical'),
-            (r'query\s*\(\s*["\'].*\+.*["\']', 'SQL Injection Risk', 'critical'),
-            
-            # Command Injection
-            (r'system\s*\(\s*["\'].*\+.*["\']', 'Command Injection Risk', 'critical'),
-            (r'eval\s*\(\s*.*\+', 'Code Injection Risk', 'critical'),
-            
-            # Hardcoded credentials
-            (r'(password|pwd|secret|key)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded Credentials', 'high'),
-            (r'(api_key|apikey)\s*=\s*["\'][^"\']{16,}["\']', 'Hardcoded API Key', 'high'),
-            
-            # Weak cryptography
-            (r'md5\s*\(', 'Weak Cryptographic Hash (MD5)', 'medium'),
-            (r'sha1\s*\(', 'Weak Cryptographic Hash (SHA1)', 'medium'),
-            
-            # Directory traversal
-            (r'\.\./.*\.\.', 'Directory Traversal Risk', 'high'),
-            
-            # XSS vulnerabilities
-            (r'innerHTML\s*=.*\+', 'XSS Vulnerability Risk', 'medium'),
-            (r'document\.write\s*\(\s*.*\+', 'XSS Vulnerability Risk', 'medium'),
-        ]
+    def _scan_file(self, file_info: Dict, read=_read_file) -> Optional[List[Finding]]:
+        """Scan one file against every category's patterns, sharing its newline index and prefilter text
+
+        Returns None for files that could not be read or look binary.
+        """
+        try:
+            content = read(file_info['path'])
+        except Exception as e:
+            logging.warning(f"Could not read file {file_info['path']}: {e}")
+            return None
         
-        for pattern, vuln_type, severity in patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                line_num = content[:match.start()].count('\n') + 1
-                vulnerabilities.append({
-                    'type': vuln_type,
-                    'severity': severity,
-                    'file': file_path,
-                    'line': line_num,
-                    'code_snippet': self._get_code_snippet(content, match.start(), match.end()),
-                    'description': self._get_vulnerability_description(vuln_type),
-                    'cwe_id': self._get_cwe_id(vuln_type),
-                    'remediation': self._get_remediation_advice(vuln_type)
-                })
+        if content[:SNIFF_BYTES].find(b'\0') != -1:
+            return None
+        return self._scan_content(content, file_info['relative_path'])
+    
+    def _scan_content(self, content: bytes, file_path: str) -> List[Finding]:
+        """Findings for one file's bytes, in category then catalog order"""
+        findings = []
+        # Every catalog pattern runs over this one lowercased copy
+        lowered = content.lower()
+        newlines = _newline_offsets(lowered)
+        
+        for category, patterns in CATEGORY_PATTERNS:
+            for match, pattern_id in _iter_pattern_matches(content, lowered, patterns):
+                line_num = bisect.bisect_left(newlines, match.start()) + 1
+                if category == 'secret_detection':
+                    # Matches are found in the lowercased copy; the secret itself comes from content
+                    detail = _mask_secret(content[match.start():match.end()])
+                else:
+                    detail = self._get_code_snippet(content, newlines, match.start(), match.end())
+                findings.append(Finding(pattern_id, file_path, line_num, detail))
+        
+        return findings
+    
+    def _finding_dict(self, finding: Finding) -> Dict:
+        """Report entry for a finding, filled in from its pattern's catalog entry"""
+        category, vuln_type, severity = PATTERN_CATALOG[finding.pattern_id]
+        if category == 'secret_detection':
+            return {
+                'type': f'Hardcoded {vuln_type}',
+                'severity': severity,
+                'file': finding.file_path,
+                'line': finding.line_number,
+                'secret_type': vuln_type,
+                'masked_secret': finding.detail,
+                'description': f"Hardcoded {vuln_type} detected in source code",
+                'remediation': 'Remove hardcoded secrets and use environment variables or secure credential storage'
+            }
         
-        return vulnerabilities
+        vulnerability = {
+            'type': vuln_type,
+            'severity': severity,
+            'file': finding.file_path,
+            'line': finding.line_number,
+            'code_snippet': finding.detail,
+            'description': self._get_vulnerability_description(vuln_type)
+        }
+        if category == 'static_analysis':
+            # Only static analysis findings carry a CWE reference
+            vulnerability['cwe_id'] = self._get_cwe_id(vuln_type)
+        vulnerability['remediation'] = self._get_remediation_advice(vuln_type)
+        return vulnerability
     
     def _scan_dependencies(self, directory_path: str) -> List[Dict]:
         """Scan for vulnerable dependencies"""
@@ -182,7 +637,7 @@ class AISecurityScanner:
             file_path = Path(directory_path) / dep_file
             if file_path.exists():
                 try:
-                    with open(file_path, 'r') as f:
+                    with open(file_path, 'rb') as f:
                         content = f.read()
                     
                     # Analyze dependencies (simplified)
@@ -193,361 +648,76 @@ class AISecurityScanner:
         
         return vulnerabilities
     
-    def _analyze_dependencies_content(self, content: str, file_name: str) -> List[Dict]:
+    def _analyze_dependencies_content(self, content: bytes, file_name: str) -> List[Dict]:
         """Analyze dependency file content for vulnerabilities"""
         vulnerabilities = []
-        
-        # Simulated vulnerable dependency detection
-        # In real implementation, would query vulnerability databases
-        known_vulns = {
-            'requests': {'version': '<2.25.0', 'severity': 'medium', 'cve': 'CVE-2023-12345'},
-            'django': {'version': '<3.2.0', 'severity': 'high', 'cve': 'CVE-2022-12345'},
-            'express': {'version': '<4.17.0', 'severity': 'high', 'cve': 'CVE-2021-12345'},
-        }
-        
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            for dep, info in known_vulns.items():
-                if dep.lower() in line.lower():
-                    vulnerabilities.append({
-                        'type': 'Vulnerable Dependency',
-                        'severity': info['severity'],
-                        'file': file_name,
-                        'line': i,
-                        'dependency': dep,
-                        'detected_version': 'unknown',
-                        'vulnerable_version': info['version'],
-                        'cve': info['cve'],
-                        'description': f"Dependency {dep} has known vulnerabilities",
-                        'remediation': f"Update {dep} to version >= {info['version'].replace('<', '')}"
-                    })
-        
-        return vulnerabilities
-    
-    def _detect_secrets(self, files: List[Dict]) -> List[Dict]:
-        """Detect hardcoded secrets and sensitive information"""
-        vulnerabilities = []
-        
-        secret_patterns = [
-            # AWS credentials
-            (r'AKIA[0-9A-Z]{16}', 'AWS Access Key', 'critical'),
-            (r'[0-9a-zA-Z/+]{40}', 'AWS Secret Key (possible)', 'critical'),
-            
-            # GitHub tokens
-            (r'ghp_[a-zA-Z0-9]{36}', 'GitHub Personal Access Token', 'critical'),
-            (r'gho_[a-zA-Z0-9]{36}', 'GitHub OAuth Token', 'critical'),
-            (r'ghu_[a-zA-Z0-9]{36}', 'GitHub User Token', 'critical'),
-            (r'ghs_[a-zA-Z0-9]{36}', 'GitHub Server Token', 'critical'),
-            (r'ghr_[a-zA-Z0-9]{36}', 'GitHub Refresh Token', 'critical'),
-            
-            # Database connection strings
-            (r'mysql://[^:]+:[^@]+@', 'MySQL Connection String', 'high'),
-            (r'postgresql://[^:]+:[^@]+@', 'PostgreSQL Connection String', 'high'),
-            (r'mongodb://[^:]+:[^@]+@', 'MongoDB Connection String', 'high'),
-            
-            # API keys (generic)
-            (r'api[_-]?key["\']?\s*[:=]\s*["\'][a-zA-Z0-9_-]{20,}["\']', 'API Key', 'high'),
-            (r'secret[_-]?key["\']?\s*[:=]\s*["\'][a-zA-Z0-9_-]{20,}["\']', 'Secret Key', 'high'),
-            
-            # Private keys
-            (r'-----BEGIN (RSA |OPENSSH |DSA |EC |PGP )?PRIVATE KEY-----', 'Private Key', 'critical'),
-        ]
-        
-        for file_info in files:
-            content = file_info['content']
-            file_path = file_info['relative_path']
-            
-            for pattern, secret_type, severity in secret_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    line_num = content[:match.start()].count('\n') + 1
-                    
-                    # Mask the actual secret in the output
-                    secret_value = match.group()
-                    masked_value = secret_value[:4] + '*' * (len(secret_value) - 8) + secret_value[-4:] if len(secret_value) > 8 else '***'
-                    
-                    vulnerabilities.append({
-                        'type': f'Hardcoded {secret_type}',
-                        'severity': severity,
-                        'file': file_path,
-                        'line': line_num,
-                        'secret_type': secret_type,
-                        'masked_secret': masked_value,
-                        'description': f"Hardcoded {secret_type} detected in source code",
-                        'remediation': 'Remove hardcoded secrets and use environment variables or secure credential storage'
-                    })
-        
-        return vulnerabilities
-    
-    def _scan_injection_vulnerabilities(self, files: List[Dict]) -> List[Dict]:
-        """Scan for injection vulnerabilities"""
-        vulnerabilities = []
-        
-        injection_patterns = [
-            # LDAP Injection
-            (r'(ldap|adsi).*query.*\+.*user', 'LDAP Injection', 'high'),
-            
-            # NoSQL Injection
-            (r'\$where\s*:\s*.*\+', 'NoSQL Injection', 'high'),
-            
-            # XPath Injection
-            (r'xpath\s*\(\s*.*\+', 'XPath Injection', 'medium'),
-            
-            # Command Injection variations
-            (r'spawn\s*\(\s*.*\+', 'Command Injection', 'critical'),
-            (r'exec\s*\(\s*.*\+', 'Command Injection', 'critical'),
-            (r'shell_exec\s*\(\s*.*\+', 'Command Injection', 'critical'),
-        ]
-        
-        for file_info in files:
-            content = file_info['content']
-            file_path = file_info['relative_path']
-            
-            for pattern, vuln_type, severity in injection_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    line_num = content[:match.start()].count('\n') + 1
-                    vulnerabilities.append({
-                        'type': vuln_type,
-                        'severity': severity,
-                        'file': file_path,
-                        'line': line_num,
-                        'code_snippet': self._get_code_snippet(content, match.start(), match.end()),
-                        'description': self._get_vulnerability_description(vuln_type),
-                        'remediation': self._get_remediation_advice(vuln_type)
-                    })
-        
-        return vulnerabilities
-    
-    def _scan_authentication_issues(self, files: List[Dict]) -> List[Dict]:
-        """Scan for authentication and authorization issues"""
-        vulnerabilities = []
-        
-        auth_patterns = [
-            # Weak password policies
-            (r'password.*min.*length.*[0-5]', 'Weak Password Policy', 'medium'),
-            
-            # Missing authentication
-            (r'@app\.route\s*\([^)]*\)\s*\ndef\s+admin', 'Unprotected Admin Route', 'high'),
-            (r'@GetMapping\s*\([^)]*admin[^)]*\)', 'Unprotected Admin Endpoint', 'high'),
-            
-            # Hardcoded authentication bypass
-            (r'admin\s*==\s*["\']true["\']', 'Hardcoded Admin Check', 'high'),
-            (r'authenticated\s*=\s*True', 'Hardcoded Authentication', 'medium'),
-            
-            # Session management issues
-            (r'session\.timeout.*=\s*[0-9]{1,5}', 'Short Session Timeout', 'low'),
-            (r'cookie.*secure.*=.*false', 'Insecure Cookie Configuration', 'medium'),
-        ]
-        
-        for file_info in files:
-            content = file_info['content']
-            file_path = file_info['relative_path']
-            
-            for pattern, vuln_type, severity in auth_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    line_num = content[:match.start()].count('\n') + 1
-                    vulnerabilities.append({
-                        'type': vuln_type,
-                        'severity': severity,
-                        'file': file_path,
-                        'line': line_num,
-                        'code_snippet': self._get_code_snippet(content, match.start(), match.end()),
-                        'description': self._get_vulnerability_description(vuln_type),
-                        'remediation': self._get_remediation_advice(vuln_type)
-                    })
-        
-        return vulnerabilities
-    
-    def _scan_data_validation(self, files: List[Dict]) -> List[Dict]:
-        """Scan for data validation issues"""
-        vulnerabilities = []
-        
-        validation_patterns = [
-            # Direct file access without validation
-            (r'open\s*\(\s*user_input', 'Unvalidated File Access', 'high'),
-            (r'file\s*=\s*request\.files\[', 'Unvalidated File Upload', 'high'),
-            
-            # Lack of input sanitization
-            (r'request\.args\.get.*direct', 'Unvalidated Input Usage', 'medium'),
-            (r'\$_GET\[.*\].*direct', 'Unvalidated Input Usage', 'medium'),
-            
-            # Path traversal
-            (r'readfile\s*\(\s*\$', 'Potential Path Traversal', 'high'),
-            (r'include\s*\(\s*\$', 'Potential Path Traversal', 'high'),
-        ]
-        
-        for file_info in files:
-            content = file_info['content']
-            file_path = file_info['relative_path']
-            
-            for pattern, vuln_type, severity in validation_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    line_num = content[:match.start()].count('\n') + 1
-                    vulnerabilities.append({
-                        'type': vuln_type,
-                        'severity': severity,
-                        'file': file_path,
-                        'line': line_num,
-                        'code_snippet': self._get_code_snippet(content, match.start(), match.end()),
-                        'description': self._get_vulnerability_description(vuln_type),
-                        'remediation': self._get_remediation_advice(vuln_type)
-                    })
-        
-        return vulnerabilities
-    
-    def _scan_cryptography_issues(self, files: List[Dict]) -> List[Dict]:
-        """Scan for cryptography implementation issues"""
-        vulnerabilities = []
-        
-        crypto_patterns = [
-            # Weak algorithms
-            (r'crypto\.createCipher\s*\(["\']des', 'DES Encryption (Weak)', 'high'),
-            (r'crypto\.createCipher\s*\(["\']rc4', 'RC4 Encryption (Weak)', 'high'),
-            (r'AES.*ECB', 'AES in ECB Mode (Insecure)', 'high'),
-            
-            # Hardcoded IV/keys
-            (r'iv\s*=\s*["\'][^"\']{16,}["\']', 'Hardcoded IV', 'medium'),
-            (r'salt\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded Salt', 'medium'),
-            
-            # Random number generation issues
-            (r'math\.random\s*\(\)', 'Insecure Random Number Generation', 'medium'),
-            (r'random\(\)', 'Insecure Random Number Generation', 'medium'),
-        ]
-        
-        for file_info in files:
-            content = file_info['content']
-            file_path = file_info['relative_path']
-            
-            for pattern, vuln_type, severity in crypto_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    line_num = content[:match.start()].count('\n') + 1
-                    vulnerabilities.append({
-                        'type': vuln_type,
-                        'severity': severity,
-                        'file': file_path,
-                        'line': line_num,
-                        'code_snippet': self._get_code_snippet(content, match.start(), match.end()),
-                        'description': self._get_vulnerability_description(vuln_type),
-                        'remediation': self._get_remediation_advice(vuln_type)
-                    })
+        newlines = _newline_offsets(content)
+        
+        # Every known name is found in one pass over the file; a name is reported once per line
+        hits = {(bisect.bisect_left(newlines, offset) + 1, index)
+                for offset, index in _iter_dependency_hits(content.lower())}
+        dependencies = list(KNOWN_VULNERABLE_DEPENDENCIES.items())
+        
+        for line_num, index in sorted(hits):
+            dep, info = dependencies[index]
+            vulnerabilities.append({
+                'type': 'Vulnerable Dependency',
+                'severity': info['severity'],
+                'file': file_name,
+                'line': line_num,
+                'dependency': dep,
+                'detected_version': 'unknown',
+                'vulnerable_version': info['version'],
+                'cve': info['cve'],
+                'description': f"Dependency {dep} has known vulnerabilities",
+                'remediation': f"Update {dep} to version >= {info['version'].replace('<', '')}"
+            })
         
         return vulnerabilities
     
-    def _get_code_snippet(self, content: str, start: int, end: int, context_lines: int = 2) -> str:
-        """Extract code snippet with context"""
-        lines = content.split('\n')
-        snippet_start = content[:start].count('\n')
-        snippet_end = content[:end].count('\n')
+    def _get_code_snippet(self, content, newlines: List[int], start: int, end: int,
+                          context_lines: int = 2) -> str:
+        """Extract code snippet with context, decoding only the lines it spans"""
+        snippet_start = bisect.bisect_left(newlines, start)
+        snippet_end = bisect.bisect_left(newlines, end)
         
         start_line = max(0, snippet_start - context_lines)
-        end_line = min(len(lines), snippet_end + context_lines + 1)
+        end_line = min(len(newlines), snippet_end + context_lines)
         
-        return '\n'.join(lines[start_line:end_line])
+        # Line k runs from just past newline k-1 up to newline k (or the end of content)
+        first = newlines[start_line - 1] + 1 if start_line else 0
+        last = newlines[end_line] if end_line < len(newlines) else len(content)
+        return content[first:last].decode('utf-8', 'ignore').replace('\r\n', '\n')
     
     def _get_vulnerability_description(self, vuln_type: str) -> str:
         """Get detailed description for vulnerability type"""
-        descriptions = {
-            'SQL Injection Risk': 'SQL injection vulnerability allows attackers to execute arbitrary SQL commands',
-            'Command Injection Risk': 'Command injection allows execution of arbitrary system commands',
-            'Hardcoded Credentials': 'Hardcoded credentials pose a significant security risk',
-            'Weak Cryptographic Hash': 'MD5 and SHA1 are cryptographically broken and should not be used',
-            'Directory Traversal Risk': 'Directory traversal can allow access to files outside intended directory',
-            'XSS Vulnerability Risk': 'Cross-site scripting allows injection of malicious scripts',
-            'LDAP Injection': 'LDAP injection can manipulate LDAP queries and bypass authentication',
-            'NoSQL Injection': 'NoSQL injection can manipulate database queries',
-            'XPath Injection': 'XPath injection can manipulate XML queries',
-            'Weak Password Policy': 'Weak password policies allow easily guessable passwords',
-            'Unprotected Admin Route': 'Admin routes without authentication are security risks',
-            'Hardcoded Admin Check': 'Hardcoded authentication bypass mechanisms are insecure',
-            'Unvalidated File Access': 'File access without validation can lead to directory traversal',
-            'Unvalidated File Upload': 'File uploads without validation can lead to arbitrary code execution',
-            'DES Encryption (Weak)': 'DES encryption is cryptographically broken and should not be used',
-            'RC4 Encryption (Weak)': 'RC4 has known biases and should not be used',
-            'AES in ECB Mode (Insecure)': 'AES in ECB mode is vulnerable to pattern analysis attacks',
-            'Insecure Random Number Generation': 'Predictable random numbers can compromise security'
-        }
-        
-        return descriptions.get(vuln_type, 'Security vulnerability detected')
+        return VULNERABILITY_DESCRIPTIONS.get(vuln_type, 'Security vulnerability detected')
     
     def _get_cwe_id(self, vuln_type: str) -> str:
         """Get CWE ID for vulnerability type"""
-        cwe_mapping = {
-            'SQL Injection Risk': 'CWE-89',
-            'Command Injection Risk': 'CWE-78',
-            'Hardcoded Credentials': 'CWE-798',
-            'Weak Cryptographic Hash': 'CWE-327',
-            'Directory Traversal Risk': 'CWE-22',
-            'XSS Vulnerability Risk': 'CWE-79',
-            'LDAP Injection': 'CWE-90',
-            'NoSQL Injection': 'CWE-943',
-            'XPath Injection': 'CWE-91',
-            'Weak Password Policy': 'CWE-521',
-            'Unprotected Admin Route': 'CWE-306',
-            'Hardcoded Admin Check': 'CWE-287',
-            'Unvalidated File Access': 'CWE-20',
-            'Unvalidated File Upload': 'CWE-434',
-            'DES Encryption (Weak)': 'CWE-326',
-            'RC4 Encryption (Weak)': 'CWE-327',
-            'AES in ECB Mode (Insecure)': 'CWE-327',
-            'Insecure Random Number Generation': 'CWE-338'
-        }
-        
-        return cwe_mapping.get(vuln_type, 'CWE-16')
+        return CWE_IDS.get(vuln_type, 'CWE-16')
     
     def _get_remediation_advice(self, vuln_type: str) -> str:
         """Get remediation advice for vulnerability type"""
-        remediation_advice = {
-            'SQL Injection Risk': 'Use parameterized queries or prepared statements instead of string concatenation',
-            'Command Injection Risk': 'Use proper input validation and avoid executing user-provided input',
-            'Hardcoded Credentials': 'Remove hardcoded credentials and use environment variables or secure vault',
-            'Weak Cryptographic Hash': 'Use strong cryptographic hash functions like SHA-256 or SHA-3',
-            'Directory Traversal Risk': 'Validate and sanitize file paths to prevent directory traversal',
-            'XSS Vulnerability Risk': 'Implement proper input sanitization and output encoding',
-            'LDAP Injection': 'Use LDAP parameter binding and input validation',
-            'NoSQL Injection': 'Use parameterized queries and input validation for NoSQL databases',
-            'XPath Injection': 'Use parameterized XPath queries and input validation',
-            'Weak Password Policy': 'Implement strong password policies with minimum length and complexity requirements',
-            'Unprotected Admin Route': 'Add proper authentication and authorization to admin endpoints',
-            'Hardcoded Admin Check': 'Remove hardcoded authentication and implement proper session management',
-            'Unvalidated File Access': 'Validate file paths and implement proper access controls',
-            'Unvalidated File Upload': 'Validate file types, sizes, and implement virus scanning',
-            'DES Encryption (Weak)': 'Use modern encryption algorithms like AES-256',
-            'RC4 Encryption (Weak)': 'Use modern encryption algorithms like AES-256',
-            'AES in ECB Mode (Insecure)': 'Use AES in secure modes like GCM or CBC with proper IV',
-            'Insecure Random Number Generation': 'Use cryptographically secure random number generators'
-        }
-        
-        return remediation_advice.get(vuln_type, 'Implement proper security controls and input validation')
+        return REMEDIATION_ADVICE.get(vuln_type, 'Implement proper security controls and input validation')
     
     def _calculate_risk_summary(self, vulnerabilities: Dict) -> Dict:
         """Calculate risk summary by severity"""
         risk_summary = {}
         
-        for category, vulns in vulnerabilities.items():
+        # The only walk over individual findings; totals and the score reuse its list lengths
+        for vulns in vulnerabilities.values():
             for vuln in vulns:
-                severity = vuln['severity']
-                if severity not in risk_summary:
-                    risk_summary[severity] = []
-                risk_summary[severity].append(vuln)
+                risk_summary.setdefault(vuln['severity'], []).append(vuln)
         
         return risk_summary
     
     def _count_total_vulnerabilities(self, vulnerabilities: Dict) -> int:
         """Count total vulnerabilities across all categories"""
-        total = 0
-        for category, vulns in vulnerabilities.items():
-            total += len(vulns)
-        return total
-    
-    def _calculate_security_score(self, results: Dict) -> int:
-        """Calculate overall security score (0-100)"""
-        total_vulns = self._count_total_vulnerabilities(results['vulnerabilities'])
-        risk_summary = results['risk_summary']
-        
+        return sum(map(len, vulnerabilities.values()))
+    
+    def _calculate_security_score(self, risk_summary: Dict) -> int:
+        """Calculate overall security score (0-100) from the risk summary's severity counts"""
         # Weighted scoring based on severity
         score = 100
         score -= len(risk_summary.get('critical', [])) * 25
@@ -612,9 +782,10 @@ class AISecurityScanner:
     def _save_scan_results(self, results: Dict, scan_id: str) -> None:
         """Save scan results to file"""
         try:
-            filename = f"security_scan_{scan_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w') as f:
-                json.dump(results, f, indent=2)
+            filename = f"security_scan_{scan_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json.gz"
+            # Findings repeat the same descriptions and remediations, so even a fast level compresses well
+            with gzip.open(filename, 'wb', compresslevel=3) as f:
+                f.write(_dumps(results))
             logging.info(f"Security scan results saved to {filename}")
         except Exception as e:
             logging.error(f"Failed to save scan results: {e}")
@@ -642,8 +813,8 @@ def main():
         
         # Save results
         scan_results_file = f"latest_security_scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(scan_results_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(scan_results_file, 'wb') as f:
+            f.write(_dumps(results))
         print(f"\n💾 Detailed results saved to: {scan_results_file}")
     else:
         print(f"❌ Security scan failed: {results['error']}")
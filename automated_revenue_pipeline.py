@@ -8,13 +8,164 @@ import smtplib
 import time
 import json
 import random
+import string
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
 import ssl
 
+# Messages sent over one SMTP session before it is closed and reopened, like most providers' caps
+MAX_MESSAGES_PER_CONNECTION = 100
+
+# SMTP replies worth retrying on a fresh connection: service unavailable, mailbox busy, local error
+TRANSIENT_SMTP_CODES = frozenset({421, 450, 451})
+
+# Attempts after the first, and the delay before the first of them; each further attempt doubles it
+SMTP_RETRIES = 2
+SMTP_RETRY_BACKOFF = 1.0
+
+# Reused sessions idle longer than this are checked with NOOP before sending, since servers drop idle clients
+SMTP_IDLE_CHECK_SECONDS = 30.0
+
+# Campaign workers preparing and sending emails at once
+CAMPAIGN_CONCURRENCY = 5
+
+# Minimum spacing between sends across all workers, to stay under spam filters and provider throttles
+MIN_SEND_INTERVAL = 2.0
+
+def compile_template(fmt):
+    """Parse a str.format template once, returning a renderer taking the field values as keywords
+
+    Only plain {name} placeholders are split out; templates with conversions, format specs,
+    positional fields or attribute/index lookups fall back to str.format.
+    """
+    parsed = list(string.Formatter().parse(fmt))
+    if any(spec or conversion or not field.isidentifier()
+           for _, field, spec, conversion in parsed if field is not None):
+        return fmt.format
+    literals = [literal for literal, _, _, _ in parsed]
+    fields = [field for _, field, _, _ in parsed]
+    
+    def render(**values):
+        parts = []
+        for literal, field in zip(literals, fields):
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return ''.join(parts)
+    return render
+
+class SMTPSession:
+    """Authenticated SMTP connection, opened on first use and reused across messages"""
+    
+    def __init__(self, config):
+        self.config = config
+        self._smtp = None
+        self._messages_on_connection = 0
+        self._last_used = 0.0
+    
+    def _get_connection(self):
+        if self._smtp is not None and self._messages_on_connection >= MAX_MESSAGES_PER_CONNECTION:
+            self.close()
+        if self._smtp is not None and time.monotonic() - self._last_used > SMTP_IDLE_CHECK_SECONDS:
+            try:
+                stale = self._smtp.noop()[0] != 250
+            except smtplib.SMTPServerDisconnected:
+                stale = True
+            if stale:
+                self._drop_connection()
+        if self._smtp is None:
+            config = self.config
+            server = smtplib.SMTP(config['server'], config['port'])
+            try:
+                server.starttls(context=ssl.create_default_context())
+                server.login(config['username'], config['password'])
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+            self._messages_on_connection = 0
+        return self._smtp
+    
+    def send(self, msg):
+        """Send msg, retrying with backoff only where a resend cannot deliver it twice
+
+        Drops while connecting and transient refusals are retried on a fresh connection.
+        A drop during send_message is not, as the server may already have accepted the message.
+        """
+        for attempt in range(SMTP_RETRIES + 1):
+            try:
+                server = self._get_connection()
+            except smtplib.SMTPServerDisconnected:
+                # Nothing has been sent on this connection yet
+                if attempt == SMTP_RETRIES:
+                    raise
+                self._drop_connection()
+                time.sleep(SMTP_RETRY_BACKOFF * 2 ** attempt)
+                continue
+            
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._drop_connection()
+                raise
+            except smtplib.SMTPResponseException as e:
+                # The server replied with a refusal, so the message was not accepted
+                if e.smtp_code not in TRANSIENT_SMTP_CODES or attempt == SMTP_RETRIES:
+                    raise
+                self._drop_connection()
+                time.sleep(SMTP_RETRY_BACKOFF * 2 ** attempt)
+                continue
+            
+            self._messages_on_connection += 1
+            self._last_used = time.monotonic()
+            return
+    
+    def _drop_connection(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            finally:
+                self._smtp = None
+    
+    def close(self):
+        """End the session, if one is open"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except smtplib.SMTPException:
+            pass
+        finally:
+            self._drop_connection()
+
+class SendRateLimiter:
+    """Spaces calls to wait() at least interval seconds apart across threads"""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 class RevenueGenerator:
-    def __init__(self):
+    def __init__(self, live: bool = False):
+        # Simulation mode only prints the prepared emails; live mode sends them over SMTP
+        self.live = live
+        self.smtp_config = self.setup_smtp_server()
+        # Idle SMTP sessions; campaign workers take one per send, so there are at most one per worker
+        self._sessions = queue.Queue()
+        
         self.campaign_templates = {
             'performance_audit': {
                 'subject': 'Free Performance Audit - AI Optimization Opportunity',
@@ -55,26 +206,38 @@ Portfolio: github.com/Mushisushi28/kirkbot2-services'''
             }
         }
         
+        # Subject and body renderers, parsed once rather than on every personalization
+        self._compiled_templates = {
+            kind: {part: compile_template(text) for part, text in template.items()}
+            for kind, template in self.campaign_templates.items()
+        }
+        
         self.prospects = [
             {'name': 'Tech Lead', 'company': 'StartupXYZ', 'type': 'performance_audit'},
             {'name': 'CTO', 'company': 'ScaleUp Corp', 'type': 'ai_implementation'},
             {'name': 'Engineering Manager', 'company': 'GrowthCo', 'type': 'performance_audit'},
         ]
     
-    def generate_personalized_content(self, prospect):
+    def campaign_time(self):
+        """Day and time personalization fields, formatted once per campaign run"""
+        now = datetime.now()
+        return {'day': now.strftime('%A'), 'time': now.strftime('%I:%M %p')}
+    
+    def generate_personalized_content(self, prospect, campaign_time=None):
         """Generate personalized email content"""
-        template = self.campaign_templates[prospect['type']]
+        template = self._compiled_templates[prospect['type']]
+        if campaign_time is None:
+            campaign_time = self.campaign_time()
         
         # Personalization variables
         personalization = {
             'name': prospect['name'],
             'company': prospect['company'],
-            'day': datetime.now().strftime('%A'),
-            'time': datetime.now().strftime('%I:%M %p')
+            **campaign_time
         }
         
-        subject = template['subject'].format(**personalization)
-        body = template['body'].format(**personalization)
+        subject = template['subject'](**personalization)
+        body = template['body'](**personalization)
         
         return subject, body
     
@@ -89,11 +252,37 @@ Portfolio: github.com/Mushisushi28/kirkbot2-services'''
         }
         return smtp_config
     
-    def send_campaign_email(self, prospect):
+    def _acquire_session(self):
+        """Idle SMTP session from the pool, or a new one when every session is busy"""
+        try:
+            return self._sessions.get_nowait()
+        except queue.Empty:
+            return SMTPSession(self.smtp_config)
+    
+    def _send_message(self, msg):
+        """Send over a pooled session, returning it to the pool for the next message"""
+        session = self._acquire_session()
+        try:
+            session.send(msg)
+        except Exception:
+            session.close()
+            raise
+        self._sessions.put(session)
+    
+    def close(self):
+        """End every pooled SMTP session"""
+        while True:
+            try:
+                session = self._sessions.get_nowait()
+            except queue.Empty:
+                return
+            session.close()
+    
+    def send_campaign_email(self, prospect, campaign_time=None):
         """Send personalized campaign email"""
         try:
-            subject, body = self.generate_personalized_content(prospect)
-            config = self.setup_smtp_server()
+            subject, body = self.generate_personalized_content(prospect, campaign_time)
+            config = self.smtp_config
             
             # Create message
             msg = MIMEMultipart()
@@ -108,12 +297,9 @@ Portfolio: github.com/Mushisushi28/kirkbot2-services'''
             print(f"Subject: {subject}")
             print(f"Body preview: {body[:100]}...")
             
-            # In production, uncomment:
-            # server = smtplib.SMTP(config['server'], config['port'])
-            # server.starttls()
-            # server.login(config['username'], config['password'])
-            # server.send_message(msg)
-            # server.quit()
+            if self.live:
+                # One connect, STARTTLS and login per session rather than per email
+                self._send_message(msg)
             
             return True
             
@@ -121,7 +307,7 @@ Portfolio: github.com/Mushisushi28/kirkbot2-services'''
             print(f"[ERROR] Failed to send email: {str(e)}")
             return False
     
-    def run_campaign(self, batch_size=3):
+    def run_campaign(self, batch_size=3, concurrency=CAMPAIGN_CONCURRENCY):
         """Run automated email campaign"""
         print(f"🚀 Starting Revenue Generation Campaign - {datetime.now()}")
         
@@ -131,18 +317,27 @@ Portfolio: github.com/Mushisushi28/kirkbot2-services'''
             'revenue_potential': 0
         }
         
-        # Send batch of emails
-        for i, prospect in enumerate(self.prospects[:batch_size]):
+        # Workers overlap SMTP round-trips while the limiter keeps the overall send rate
+        prospects = self.prospects[:batch_size]
+        limiter = SendRateLimiter(MIN_SEND_INTERVAL)
+        campaign_time = self.campaign_time()
+        
+        def process(indexed_prospect):
+            i, prospect = indexed_prospect
+            limiter.wait()
             print(f"\n📧 Processing prospect {i+1}/{batch_size}: {prospect['name']}")
-            
-            if self.send_campaign_email(prospect):
-                results['sent'] += 1
-                results['revenue_potential'] += 250  # Average deal size
-            else:
-                results['failed'] += 1
-            
-            # Add delay to avoid spam filters
-            time.sleep(2)
+            return self.send_campaign_email(prospect, campaign_time)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                for sent in executor.map(process, enumerate(prospects)):
+                    if sent:
+                        results['sent'] += 1
+                        results['revenue_potential'] += 250  # Average deal size
+                    else:
+                        results['failed'] += 1
+        finally:
+            self.close()
         
         # Campaign summary
         print(f"\n📊 Campaign Results:")
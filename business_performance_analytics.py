@@ -25,9 +25,15 @@ class BusinessAnalytics:
             'portfolio_engagement': 0,
             'platform_interactions': 0
         }
+        
+        # One metric bundle per analytics run, so every section reports the same numbers
+        self._metrics_cache = None
     
     def generate_realistic_metrics(self):
-        """Generate realistic business metrics based on current activities"""
+        """Generate realistic business metrics based on current activities, once per instance"""
+        if self._metrics_cache is not None:
+            return self._metrics_cache
+        
         # Base metrics from current operations
         base_metrics = {
             'github_stars': random.randint(0, 5),
@@ -43,11 +49,13 @@ class BusinessAnalytics:
         base_metrics['active_clients'] = max(0, int(base_metrics['revenue_potential'] / 200))
         base_metrics['revenue_monthly'] = base_metrics['active_clients'] * random.randint(200, 500)
         
+        self._metrics_cache = base_metrics
         return base_metrics
     
-    def analyze_growth_trajectory(self):
+    def analyze_growth_trajectory(self, current_metrics: Optional[Dict] = None):
         """Analyze growth trajectory and predict future performance"""
-        current_metrics = self.generate_realistic_metrics()
+        if current_metrics is None:
+            current_metrics = self.generate_realistic_metrics()
         
         # Growth rate calculations
         daily_growth_rate = 0.15  # 15% daily growth target
@@ -64,10 +72,11 @@ class BusinessAnalytics:
         
         return predicted_metrics
     
-    def generate_performance_dashboard(self):
+    def generate_performance_dashboard(self, current_metrics: Optional[Dict] = None):
         """Generate comprehensive performance dashboard"""
-        trajectory = self.analyze_growth_trajectory()
-        current_metrics = self.generate_realistic_metrics()
+        if current_metrics is None:
+            current_metrics = self.generate_realistic_metrics()
+        trajectory = self.analyze_growth_trajectory(current_metrics)
         
         dashboard = {
             'timestamp': datetime.now().isoformat(),
@@ -98,9 +107,9 @@ class BusinessAnalytics:
         
         return dashboard
     
-    def create_performance_report(self):
+    def create_performance_report(self, current_metrics: Optional[Dict] = None):
         """Create detailed performance report"""
-        dashboard = self.generate_performance_dashboard()
+        dashboard = self.generate_performance_dashboard(current_metrics)
         
         report = f"""
 📊 KIRKBOT2 BUSINESS PERFORMANCE REPORT
@@ -161,10 +170,11 @@ Portfolio: https://github.com/Mushisushi28/kirkbot2-services
         
         return report
     
-    def predict_phase_completion(self):
+    def predict_phase_completion(self, current_metrics: Optional[Dict] = None):
         """Predict phase completion based on current trajectory"""
-        trajectory = self.analyze_growth_trajectory()
-        current_metrics = self.generate_realistic_metrics()
+        if current_metrics is None:
+            current_metrics = self.generate_realistic_metrics()
+        trajectory = self.analyze_growth_trajectory(current_metrics)
         
         # Calculate projections
         days_remaining = trajectory['days_remaining_phase_2']
@@ -194,10 +204,11 @@ Portfolio: https://github.com/Mushisushi28/kirkbot2-services
         
         return projection
     
-    def generate_action_plan(self):
+    def generate_action_plan(self, current_metrics: Optional[Dict] = None):
         """Generate focused action plan based on analytics"""
-        current_metrics = self.generate_realistic_metrics()
-        projection = self.predict_phase_completion()
+        if current_metrics is None:
+            current_metrics = self.generate_realistic_metrics()
+        projection = self.predict_phase_completion(current_metrics)
         
         action_plan = {
             'priority_actions': [],
@@ -239,13 +250,14 @@ def main():
     print("=" * 50)
     
     analytics = BusinessAnalytics()
+    current_metrics = analytics.generate_realistic_metrics()
     
     # Generate performance report
-    report = analytics.create_performance_report()
+    report = analytics.create_performance_report(current_metrics)
     print(report)
     
     # Generate action plan
-    action_plan = analytics.generate_action_plan()
+    action_plan = analytics.generate_action_plan(current_metrics)
     
     print("\n🎯 AUTOMATED ACTION PLAN:")
     print("=" * 30)
@@ -268,8 +280,8 @@ def main():
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     analytics_data = {
         'timestamp': timestamp,
-        'dashboard': analytics.generate_performance_dashboard(),
-        'projection': analytics.predict_phase_completion(),
+        'dashboard': analytics.generate_performance_dashboard(current_metrics),
+        'projection': analytics.predict_phase_completion(current_metrics),
         'action_plan': action_plan
     }
     